@@ -14,10 +14,17 @@ from tag import Tag
 
 # python std lib imports #
 from typing import Self
-from xml.dom import minidom
+
+# 3rd party imports #
+from lxml import etree
+
+_DEFAULT_CREATED_DATE = '2023-04-13T12:30:52.518Z'
+_DEFAULT_EDITED_DATE = '2023-12-26T18:39:04.664Z'
 
 
 class AddOnInstructionTag(Tag):
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  description: str | None = None,
@@ -36,48 +43,50 @@ class AddOnInstructionTag(Tag):
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
         """ generate a tag CLA object from l5x
         """
-        if not xml_node:
+        if xml_node is None:
             return None
+        ga = xml_node.get
+        dt_name = ga('DataType', '')
 
         try:
-            datatype = kwargs['datatypes'].by_name(xml_node.getAttribute('DataType'))
+            datatype = kwargs['datatypes'].by_name(dt_name)
         except KeyError:
             datatype = None
-        return cls(xml_node.getAttribute('Name'),
+        return cls(ga('Name', ''),
                    get_text_data(xml_node, 'Description'),
                    datatype,
-                   xml_node.getAttribute('DataType'),
-                   LogixRadix.from_string(xml_node.getAttribute('Radix')),
-                   xml_node.getAttribute('ExternalAccess'))
+                   dt_name,
+                   LogixRadix.from_string(ga('Radix', '')),
+                   ga('ExternalAccess', ''))
 
     def get_dependencies(self,
-                         include_root: bool = False) -> [PyLogixObject]:
+                         include_root: bool = False,
+                         *,
+                         _acc: PyLogixDependencies | None = None) -> PyLogixDependencies:
         """ get a list of all datatypes this add-on instruction depends on
         """
         if not self.datatype:
             raise ValueError(f'no datatype associated with add-on instruction tag: {self.name}')
-        return self.datatype.get_dependencies(include_root)
+        return self.datatype.get_dependencies(include_root,
+                                              _acc=_acc)
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        local_tag_root = root.createElement('LocalTag')
-        local_tag_root.setAttribute('Name', self.name)
-        local_tag_root.setAttribute('DataType', self.datatype_meta_name)
-        local_tag_root.setAttribute('Radix', str(self.radix.value))
-        local_tag_root.setAttribute('ExternalAccess', self.external_access)
+                        include_dependencies: bool = False) -> etree._Element:
+        local_tag_root = etree.Element('LocalTag',
+                                       attrib={'Name': self.name,
+                                               'DataType': self.datatype_meta_name,
+                                               'Radix': self.radix.value,
+                                               'ExternalAccess': self.external_access})
 
         if self.description:
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            desc_root.appendChild(root.createTextNode(''))
-            local_tag_root.appendChild(desc_root)
+            desc_root = etree.SubElement(local_tag_root, 'Description')
+            desc_root.text = etree.CDATA(self.description)
 
         return local_tag_root
 
@@ -85,6 +94,8 @@ class AddOnInstructionTag(Tag):
 class AddOnInstructionParameter(PyLogixObject):
     """ logix add on instruction parameter
     """
+    __slots__ = ('tag_type', 'datatype', 'datatype_meta_name', 'usage', 'radix', 'required', 'visible', 'constant',
+                 'dimensions', 'external_access')
 
     class AddOnInstructionParameterUsage(ExtendedEnum):
         input = 'Input'
@@ -124,69 +135,69 @@ class AddOnInstructionParameter(PyLogixObject):
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           class_constructor: type[Self] | None = None,
                           *args,
                           **kwargs):
-        if not xml_node:
+        if xml_node is None:
             return None
+        ga = xml_node.get
 
-        try:
-            datatype = next((datatype for datatype in kwargs['controller'].datatypes if
-                             datatype.name == xml_node.getAttribute('DataType')), None)
-        except KeyError:
-            datatype = None
+        dt_name = ga('DataType', '')
+        controller = kwargs.get('controller')
+        datatype = controller.datatypes.by_name(dt_name) if controller else None
 
         constructor = class_constructor if class_constructor else cls
-        return constructor(xml_node.getAttribute('Name'),
+        return constructor(ga('Name', ''),
                            get_text_data(xml_node, 'Description'),
-                           LogixTagType.from_string(xml_node.getAttribute('TagType')),
+                           LogixTagType.from_string(ga('TagType', '')),
                            datatype,
-                           xml_node.getAttribute('DataType'),
+                           dt_name,
                            AddOnInstructionParameter.AddOnInstructionParameterUsage.from_string(
-                               xml_node.getAttribute('Usage')),
-                           LogixRadix.from_string(xml_node.getAttribute('Radix')),
-                           True if xml_node.getAttribute('Required') == 'true' else False,
-                           True if xml_node.getAttribute('Visible') == 'true' else False,
-                           xml_node.getAttribute('ExternalAccess'),
-                           bool_from_l5x(xml_node.getAttribute('Constant')),
-                           xml_node.getAttribute('Dimensions'))
+                               ga('Usage', '')),
+                           LogixRadix.from_string(ga('Radix', '')),
+                           True if ga('Required', '') == 'true' else False,
+                           True if ga('Visible', '') == 'true' else False,
+                           ga('ExternalAccess', ''),
+                           bool_from_l5x(ga('Constant', '')),
+                           ga('Dimensions', ''))
 
     def get_dependencies(self,
-                         include_root: bool = False) -> [PyLogixObject]:
+                         include_root: bool = False,
+                         *,
+                         _acc: PyLogixDependencies | None = None) -> PyLogixDependencies:
         if not self.datatype:
             raise ValueError(f'no datatype associated with add-on instruction parameter: {self.name}')
-        return self.datatype.get_dependencies(include_root=include_root)
+        return self.datatype.get_dependencies(include_root=include_root,
+                                              _acc=_acc)
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        param_root = root.createElement('Parameter')
-        param_root.setAttribute('Name', self.name)
-        param_root.setAttribute('TagType', self.tag_type.value.__str__())
-        param_root.setAttribute('DataType', self.datatype_meta_name)
+                        include_dependencies: bool = False) -> etree._Element:
+        attrs = {'Name': self.name,
+                 'TagType': self.tag_type.value,
+                 'DataType': self.datatype_meta_name}
 
         if self.dimensions:
-            param_root.setAttribute('Dimensions', str(self.dimensions))
+            attrs['Dimensions'] = str(self.dimensions)
 
-        param_root.setAttribute('Usage', self.usage.value.__str__())
+        attrs['Usage'] = self.usage.value
         if self.radix:
-            param_root.setAttribute('Radix', self.radix.value)
-        param_root.setAttribute('Required', bool_to_l5x(self.required))
-        param_root.setAttribute('Visible', bool_to_l5x(self.visible))
+            attrs['Radix'] = self.radix.value
+        attrs['Required'] = bool_to_l5x(self.required)
+        attrs['Visible'] = bool_to_l5x(self.visible)
 
         if self.external_access:
-            param_root.setAttribute('ExternalAccess', self.external_access)
+            attrs['ExternalAccess'] = self.external_access
 
         if self.constant:
-            param_root.setAttribute('Constant', bool_to_l5x(self.constant))
+            attrs['Constant'] = bool_to_l5x(self.constant)
+
+        param_root = etree.Element('Parameter', attrib=attrs)
 
         if self.description:
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            desc_root.appendChild(root.createTextNode(''))
-            param_root.appendChild(desc_root)
+            desc_root = etree.SubElement(param_root, 'Description')
+            desc_root.text = etree.CDATA(self.description)
 
         return param_root
 
@@ -194,6 +205,11 @@ class AddOnInstructionParameter(PyLogixObject):
 class AddOnInstructionDefinition(PyLogixObject):
     """ logix add on instruction
         """
+    __slots__ = ('logix_class', 'revision', 'vendor', 'execute_prescan', 'execute_postscan', 'execute_enable_in_false',
+                 'created_date', 'created_by', 'edited_date', 'edited_by', 'software_revision', 'revision_note',
+                 'parameters', 'tags', 'routines')
+    l5x_node_name = 'AddOnInstructionDefinition'
+    l5x_parent_node_name = 'AddOnInstructionDefinitions'
 
     def __init__(self,
                  name: str,
@@ -228,69 +244,66 @@ class AddOnInstructionDefinition(PyLogixObject):
         self.tags: [AddOnInstructionTag] = []
         self.routines: [Routine] = []
 
-    @property
-    def l5x_node_name(self):
-        return 'AddOnInstructionDefinition'
-
-    @property
-    def l5x_parent_node_name(self):
-        return self.l5x_node_name + 's'
-
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
-        if not xml_node:
+        if xml_node is None:
             return None
-        aoi = cls(xml_node.getAttribute('Name'),
+        ga = xml_node.get
+        aoi = cls(ga('Name', ''),
                   get_text_data(xml_node, 'Description'),
-                  LogixClass.from_string(xml_node.getAttribute('Class')),
-                  xml_node.getAttribute('Revision'),
-                  xml_node.getAttribute('Vendor'),
-                  bool_from_l5x(xml_node.getAttribute('ExecutePrescan')),
-                  bool_from_l5x(xml_node.getAttribute('ExecutePostscan')),
-                  bool_from_l5x(xml_node.getAttribute('ExecuteEnableInFalse')),
-                  xml_node.getAttribute('CreatedDate'),
-                  xml_node.getAttribute('CreatedBy'),
-                  xml_node.getAttribute('EditedDate'),
-                  xml_node.getAttribute('EditedBy'),
-                  xml_node.getAttribute('SoftwareRevision'),
+                  LogixClass.from_string(ga('Class', '')),
+                  ga('Revision', ''),
+                  ga('Vendor', ''),
+                  bool_from_l5x(ga('ExecutePrescan', '')),
+                  bool_from_l5x(ga('ExecutePostscan', '')),
+                  bool_from_l5x(ga('ExecuteEnableInFalse', '')),
+                  ga('CreatedDate', ''),
+                  ga('CreatedBy', ''),
+                  ga('EditedDate', ''),
+                  ga('EditedBy', ''),
+                  ga('SoftwareRevision', ''),
                   get_text_data(xml_node, 'RevisionNote'))
 
         parameters_list_xml = get_first_element(xml_node, 'Parameters')
-        if parameters_list_xml:
-            aoi.parameters.extend([AddOnInstructionParameter.from_l5x_xml_node(member_node,
-                                                                               **kwargs) for member_node in
-                                   [x for x in parameters_list_xml.childNodes if isinstance(x, minidom.Element)]])
+        if parameters_list_xml is not None:
+            aoi.parameters.extend(AddOnInstructionParameter.from_l5x_xml_node(member_node,
+                                                                              **kwargs) for member_node in
+                                  parameters_list_xml.iterchildren(etree.Element))
 
         tags_list_xml = get_first_element(xml_node, 'LocalTags')
-        if tags_list_xml:
-            aoi.tags.extend([AddOnInstructionTag.from_l5x_xml_node(tag_node,
-                                                                   **kwargs) for tag_node in
-                             [x for x in tags_list_xml.childNodes if isinstance(x, minidom.Element)]])
+        if tags_list_xml is not None:
+            aoi.tags.extend(AddOnInstructionTag.from_l5x_xml_node(tag_node,
+                                                                  **kwargs) for tag_node in
+                            tags_list_xml.iterchildren(etree.Element))
 
         routines_list_xml = get_first_element(xml_node, 'Routines')
-        if routines_list_xml:
-            aoi.routines.extend([Routine.from_l5x_xml_node(routine_node,
-                                                           **kwargs) for routine_node in
-                                 [x for x in routines_list_xml.childNodes if isinstance(x, minidom.Element)]])
+        if routines_list_xml is not None:
+            aoi.routines.extend(Routine.from_l5x_xml_node(routine_node,
+                                                          **kwargs) for routine_node in
+                                routines_list_xml.iterchildren(etree.Element))
 
         return aoi
 
     def get_dependencies(self,
-                         include_root: bool = False) -> [PyLogixObject]:
+                         include_root: bool = False,
+                         *,
+                         _acc: PyLogixDependencies | None = None) -> PyLogixDependencies:
         """ get a list of all objects this add-on instruction depends on
         """
-        dependencies = PyLogixDependencies()
+        dependencies = _acc if _acc is not None else PyLogixDependencies()
         if include_root:
-            dependencies.safe_add_item(dependencies.add_on_instructions,
-                                       self)
+            dependencies.add_item('add_on_instructions',
+                                  self)
         for tag in self.tags:
-            dependencies.extend(tag.get_dependencies(include_root=include_root))
+            tag.get_dependencies(include_root=include_root,
+                                 _acc=dependencies)
 
         for param in self.parameters:
-            dependencies.extend(param.get_dependencies(include_root=include_root))
+            param.get_dependencies(include_root=include_root,
+                                   _acc=dependencies)
 
         return dependencies
 
@@ -304,61 +317,43 @@ class AddOnInstructionDefinition(PyLogixObject):
             'TargetLastEdited': self.edited_date
         }
 
-    def rename_strings(self,
-                       _old_name: str,
-                       _new_name: str):
-        super().rename_strings(_old_name, _new_name)
-        self.name = self.name.replace(_old_name, _new_name)
-        self.description = self.description.replace(_old_name, _new_name)
-
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        aoi_root = root.createElement('AddOnInstructionDefinition')
-
-        if as_target:
-            aoi_root.setAttribute('Use', 'Target')
-
-        aoi_root.setAttribute('Name', self.name)
-        aoi_root.setAttribute('Class', self.logix_class.value.__str__())
-        aoi_root.setAttribute('Revision', self.revision)
-        aoi_root.setAttribute('Vendor', self.vendor)
-        aoi_root.setAttribute('ExecutePrescan', bool_to_l5x(self.execute_prescan))
-        aoi_root.setAttribute('ExecutePostscan', bool_to_l5x(self.execute_postscan))
-        aoi_root.setAttribute('ExecuteEnableInFalse', bool_to_l5x(self.execute_enable_in_false))
-        aoi_root.setAttribute('CreatedDate', self.created_date if self.created_date else "2023-04-13T12:30:52.518Z")
-        aoi_root.setAttribute('CreatedBy', self.created_by)
-        aoi_root.setAttribute('EditedDate', self.edited_date if self.edited_date else "2023-12-26T18:39:04.664Z")
-        aoi_root.setAttribute('EditedBy', self.edited_by)
-        aoi_root.setAttribute('SoftwareRevision', self.software_revision)
+                        include_dependencies: bool = False) -> etree._Element:
+        attrs = {'Use': 'Target'} if as_target else {}
+        attrs.update({'Name': self.name,
+                      'Class': self.logix_class.value,
+                      'Revision': self.revision,
+                      'Vendor': self.vendor,
+                      'ExecutePrescan': bool_to_l5x(self.execute_prescan),
+                      'ExecutePostscan': bool_to_l5x(self.execute_postscan),
+                      'ExecuteEnableInFalse': bool_to_l5x(self.execute_enable_in_false),
+                      'CreatedDate': self.created_date or _DEFAULT_CREATED_DATE,
+                      'CreatedBy': self.created_by,
+                      'EditedDate': self.edited_date or _DEFAULT_EDITED_DATE,
+                      'EditedBy': self.edited_by,
+                      'SoftwareRevision': self.software_revision})
+        aoi_root = etree.Element('AddOnInstructionDefinition', attrib=attrs)
 
         if self.description:
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            desc_root.appendChild(root.createTextNode(''))
-            aoi_root.appendChild(desc_root)
+            desc_root = etree.SubElement(aoi_root, 'Description')
+            desc_root.text = etree.CDATA(self.description)
 
         if self.revision_note:
-            rev_root = root.createElement('RevisionNote')
-            rev_root.appendChild(root.createCDATASection(self.revision_note))
-            rev_root.appendChild(root.createTextNode(''))
-            aoi_root.appendChild(rev_root)
+            rev_root = etree.SubElement(aoi_root, 'RevisionNote')
+            rev_root.text = etree.CDATA(self.revision_note)
 
-        parameters_root = root.createElement('Parameters')
+        parameters_root = etree.SubElement(aoi_root, 'Parameters')
         for param in self.parameters:
-            parameters_root.appendChild(param.to_l5x_xml_node(root))
-        aoi_root.appendChild(parameters_root)
+            parameters_root.append(param.to_l5x_xml_node())
 
-        local_tags_root = root.createElement('LocalTags')
+        local_tags_root = etree.SubElement(aoi_root, 'LocalTags')
         for tag in self.tags:
-            local_tags_root.appendChild(tag.to_l5x_xml_node(root))
-        aoi_root.appendChild(local_tags_root)
+            local_tags_root.append(tag.to_l5x_xml_node())
 
-        routines_root = root.createElement('Routines')
+        routines_root = etree.SubElement(aoi_root, 'Routines')
         for routine in self.routines:
-            routines_root.appendChild(routine.to_l5x_xml_node(root))
-        aoi_root.appendChild(routines_root)
+            routines_root.append(routine.to_l5x_xml_node())
 
         return aoi_root
 
@@ -11,7 +11,16 @@
 from typing import Self
 
 
+def _lower_name(obj) -> str:
+    return obj.name.lower()
+
+
+_BUCKETS = ('add_on_instructions', 'datatypes', 'modules', 'programs', 'tags', 'program_tags', 'tasks')
+
+
 class PyLogixDependencies:
+    __slots__ = _BUCKETS + ('_names',)
+
     def __init__(self):
         self.add_on_instructions: [] = []
         self.datatypes: [] = []
@@ -20,23 +29,31 @@ class PyLogixDependencies:
         self.tags: [] = []
         self.program_tags: [] = []
         self.tasks: [] = []
+        self._names: {str: set} = {bucket: set() for bucket in _BUCKETS}  # names held by each bucket
+
+    def add_item(self, bucket: str, item):
+        """ append item to the named bucket (e.g. 'tags') unless the bucket already holds an item of the same name\n
+            the held names are tracked by add_item and extend, so add to the buckets through these methods
+            """
+        names = self._names[bucket]
+        name = item.name
+        if name not in names:
+            names.add(name)
+            getattr(self, bucket).append(item)
 
     def extend(self, other: Self):
         if not other:
             return
-        self.__safe_add__(self.add_on_instructions, other.add_on_instructions)
-        self.__safe_add__(self.datatypes, other.datatypes)
-        self.__safe_add__(self.modules, other.modules)
-        self.__safe_add__(self.programs, other.programs)
-        self.__safe_add__(self.tags, other.tags)
-        self.__safe_add__(self.program_tags, other.program_tags)
-        self.__safe_add__(self.tasks, other.tasks)
+        for bucket in _BUCKETS:
+            self.__safe_add__(bucket, getattr(other, bucket))
 
-    @staticmethod
-    def __safe_add__(list1: [], list2: []):
-        for item in list2:
-            if item not in list1:
-                list1.append(item)
+    def __safe_add__(self, bucket: str, items: []):
+        my_list, names = getattr(self, bucket), self._names[bucket]
+        for item in items:
+            name = item.name
+            if name not in names:
+                names.add(name)
+                my_list.append(item)
 
     @staticmethod
     def safe_add_item(my_list: [], item):
@@ -44,9 +61,9 @@ class PyLogixDependencies:
             my_list.append(item)
 
     def sort(self):
-        self.add_on_instructions = sorted(self.add_on_instructions, key=lambda x: x.name.lower())
-        self.datatypes = sorted(self.datatypes, key=lambda x: x.name.lower())
-        self.modules = sorted(self.modules, key=lambda x: x.name.lower())
-        self.programs = sorted(self.programs, key=lambda x: x.name.lower())
-        self.tags = sorted(self.tags, key=lambda x: x.name.lower())
-        self.tasks = sorted(self.tasks, key=lambda x: x.name.lower())
+        self.add_on_instructions.sort(key=_lower_name)
+        self.datatypes.sort(key=_lower_name)
+        self.modules.sort(key=_lower_name)
+        self.programs.sort(key=_lower_name)
+        self.tags.sort(key=_lower_name)
+        self.tasks.sort(key=_lower_name)
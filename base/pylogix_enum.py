@@ -14,7 +14,11 @@ import enum
 class ExtendedEnum(enum.Enum):
     @classmethod
     def from_string(cls, string: str):
-        return next((x for x in cls if x.value == string), None)
+        """ get the member holding value string, or None\n
+            looks up the value -> member map the enum machinery builds when the class is created
+            (aliases map to the first member defined with that value)
+            """
+        return cls._value2member_map_.get(string)
 
 
 class PyLogixObjectStatus(ExtendedEnum):
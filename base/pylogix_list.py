@@ -4,45 +4,136 @@
     this file manages list override for pylogix
     """
 # pylogix imports #
-from l5x import open_l5x_to_controller_node, get_first_element, l5x_content_wrapper, generic_controller_wrapper, \
-    write_xml_to_l5x
+from l5x import get_first_element, l5x_content_attributes, l5x_stream_writer, write_l5x_stream_group, \
+    L5X_CONTEXT_EXPORT_OPTIONS, L5X_READ_BUFFER_SIZE
 from base.pylogix_dependencies import PyLogixDependencies
 from base.pylogix_object import PyLogixObject
 
 # python std lib imports #
 from typing import Any, Self
-from xml.dom import minidom
+
+# 3rd party imports #
+from lxml import etree
 
 
 class PylogixList[T](list):
+    l5x_child_keyword: str = ''
+    l5x_keyword: str = ''
+    _ctor_type: type  # resolved object_constructor_type, set per child class
+    _index_stale: bool = True  # lists built without __init__ (e.g. unpickled) index themselves on first use
+    _duplicate_names: bool = False
+    _index_renames: int = -1
+
     def __init__(self):
         super().__init__()
+        self._by_name: {str: T} = {}
+        self._index_stale: bool = False  # set when the list is changed outside append / remove
+        self._duplicate_names: bool = False  # set when a rebuild finds more than one member with the same name
+        self._index_renames: int = PyLogixObject.renames  # renames counted when the index was built
+
+    def __contains__(self, __object) -> bool:
+        """ override to check membership against the name index (objects compare equal by name)
+        """
+        name = getattr(__object, 'name', None)
+        if name is None:
+            return super().__contains__(__object)
+        return self.__find__(name) is not None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._index_stale = True
+
+    def __getstate__(self) -> {}:
+        state = self.__dict__.copy()
+        state.pop('_by_name', None)
+        return state
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._index_stale = True
+        return result
+
+    def __imul__(self, other):
+        result = super().__imul__(other)
+        self._index_stale = True
+        return result
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._index_stale = True
+
+    def __find__(self,
+                 name: str) -> T | None:
+        """ find the first member holding name through the name index\n
+            members can be renamed while they are held, so a hit is checked against the member's current name,
+            and a miss is checked again only if some object has been renamed since the index was built
+            """
+        hit = self.__sync_index__().get(name)
+        if hit is None:
+            if self._index_renames == PyLogixObject.renames:
+                return None
+        elif hit.name == name:
+            return hit
+        self._index_stale = True
+        return self.__sync_index__().get(name)
+
+    def __setstate__(self, state: {}):
+        """ copy / deepcopy restore list items after the state and pickle before it, so rebuild the index on first use
+        """
+        self.__dict__.update(state)
+        self._by_name = {}
+        self._index_stale = True
+        self._duplicate_names = False
+
+    def __sync_index__(self) -> {str: T}:
+        """ get the name index of this list\n
+            the index is rebuilt if the list was changed outside of append / remove since it was last built.
+            the first member holding a name wins, as with a linear search
+            """
+        if self._index_stale:
+            index = {}
+            duplicate_names = False
+            for item in self:
+                name = item.name
+                if name in index:
+                    duplicate_names = True
+                    continue
+                index[name] = item
+            self._by_name = index
+            self._duplicate_names = duplicate_names
+            self._index_renames = PyLogixObject.renames
+            self._index_stale = False
+        return self._by_name
 
     @property
     def object_constructor_type(self):
         raise NotImplementedError('object constructor type must be overridden by child class')
 
-    @property
-    def l5x_child_keyword(self):
-        return self.object_constructor_type.__name__
-
-    @property
-    def l5x_keyword(self):
-        return self.object_constructor_type.__name__ + 's'
+    def __init_subclass__(cls, **kwargs):
+        """ resolve the constructor type and l5x keywords once per list class rather than on every access\n
+            a child class may still declare either keyword explicitly
+            """
+        super().__init_subclass__(**kwargs)
+        constructor_type = cls.__dict__.get('object_constructor_type')
+        if constructor_type is None:
+            return
+        if isinstance(constructor_type, property):
+            constructor_type = constructor_type.fget(cls)
+        cls._ctor_type = constructor_type
+        if 'l5x_child_keyword' not in cls.__dict__:
+            cls.l5x_child_keyword = constructor_type.__name__
+        if 'l5x_keyword' not in cls.__dict__:
+            cls.l5x_keyword = constructor_type.__name__ + 's'
 
     @staticmethod
     def __to_l5x_xml_node__(node_name: str,
                             object_list: [],
-                            root: minidom.Document,
                             as_target: bool = False,
-                            include_dependencies: bool = False) -> minidom.Element:
-        objects_root = root.createElement(node_name)
-        for item in object_list:
-            append_obj = item.to_l5x_xml_node(root,
-                                              as_target=as_target,
-                                              include_dependencies=include_dependencies)
-            if append_obj:
-                objects_root.appendChild(append_obj)
+                            include_dependencies: bool = False) -> etree._Element:
+        objects_root = etree.Element(node_name)
+        objects_root.extend(node for node in (item.to_l5x_xml_node(as_target=as_target,
+                                                                   include_dependencies=include_dependencies)
+                                              for item in object_list) if node is not None)
         return objects_root
 
     def append(self,
@@ -50,27 +141,46 @@ class PylogixList[T](list):
                __overwrite: bool = False) -> bool:
         """ override to safe append object to list
         """
-        if type(__object) is self.object_constructor_type:
-            if __object in self and __overwrite:
-                super().remove(__object)
-                super().append(__object)
-                return True
-            elif __object not in self:
-                super().append(__object)
-                return True
-        return False
+        if not isinstance(__object, self._ctor_type):
+            return False
+        existing = self.__find__(__object.name)
+        if existing is not None:
+            if not __overwrite:
+                return False
+            super().remove(existing)
+        super().append(__object)
+        self._by_name[__object.name] = __object
+        return True
+
+    def append_from_l5x_xml_node(self,
+                                 xml_node: etree._Element,
+                                 *args,
+                                 **kwargs) -> bool:
+        """ construct an object of this list's type from an l5x node and append it
+        """
+        return self.append(self._ctor_type.from_l5x_xml_node(xml_node,
+                                                             *args,
+                                                             **kwargs))
 
     def by_name(self,
                 name: str) -> Any:
-        return next((item for item in self if item.name == name), None)
+        return self.__find__(name)
+
+    def clear(self):
+        super().clear()
+        self._by_name = {}
+        self._index_stale = False
+        self._duplicate_names = False
+        self._index_renames = PyLogixObject.renames
 
     def extend(self,
                __iterable,
                __overwrite: bool = False):
         """ override to safe append iterable list to self
         """
-        [self.append(__iter,
-                     __overwrite) for __iter in __iterable]
+        for __iter in __iterable:
+            self.append(__iter,
+                        __overwrite)
 
     def from_l5x(self,
                  l5x_path: str,
@@ -79,21 +189,66 @@ class PylogixList[T](list):
         try:
             ctrl_node = kwargs['ctrl_node']
         except KeyError:
-            ctrl_node = open_l5x_to_controller_node(l5x_path)
+            self.from_l5x_stream(l5x_path,
+                                 *args,
+                                 **kwargs)
+            return
 
         objects_node = get_first_element(ctrl_node,
                                          self.l5x_keyword)
-        if not objects_node:
+        if objects_node is None:
             return
 
-        for node in [node for node in objects_node.childNodes if isinstance(node, minidom.Element)]:
-            self.append(self.object_constructor_type.from_l5x_xml_node(node,
-                                                                       *args,
-                                                                       **kwargs))
+        for node in objects_node.iterchildren(etree.Element):
+            self.append_from_l5x_xml_node(node,
+                                          *args,
+                                          **kwargs)
+
+        self.rebind(*args,
+                    **kwargs)
+
+    def from_l5x_stream(self,
+                        l5x_path: str,
+                        *args,
+                        **kwargs):
+        """ build this list from an l5x file without loading the whole document\n
+            each controller scoped object node is cleared (along with its already processed siblings)
+            as soon as it has been constructed, so peak memory stays at roughly one object
+            """
+        with open(l5x_path, 'rb', buffering=L5X_READ_BUFFER_SIZE) as l5x_file:
+            for _, elem in etree.iterparse(l5x_file,
+                                           events=('end',),
+                                           tag=self.l5x_child_keyword,
+                                           huge_tree=True):
+                parent = elem.getparent()
+                if parent is None or parent.tag != self.l5x_keyword:
+                    continue
+                grandparent = parent.getparent()
+                if grandparent is None or grandparent.tag != 'Controller':
+                    continue
+
+                self.append_from_l5x_xml_node(elem,
+                                              *args,
+                                              **kwargs)
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del parent[0]
 
         self.rebind(*args,
                     **kwargs)
 
+    def insert(self,
+               __index,
+               __object):
+        super().insert(__index, __object)
+        self._index_stale = True
+
+    def pop(self,
+            __index=-1):
+        item = super().pop(__index)
+        self._index_stale = True
+        return item
+
     def push_updates(self,
                      other_list: Self):
         raise NotImplementedError('This method must be overridden by the over-riding class')
@@ -111,16 +266,26 @@ class PylogixList[T](list):
                __object) -> bool:
         """ override to safe remove object from list
         """
-        if __object in self and type(__object) is self.object_constructor_type:
-            super().remove(__object)
-            return True
-        return False
+        if not isinstance(__object, self._ctor_type):
+            return False
+        if self.__find__(__object.name) is None:
+            return False
+        super().remove(__object)
+        if self._duplicate_names:
+            self._index_stale = True  # another member may hold the same name
+        else:
+            del self._by_name[__object.name]
+        return True
+
+    def apply_renames(self,
+                      mapping: {str: str}):
+        for x in self:
+            x.apply_renames(mapping)
 
     def rename_strings(self,
                        _old_name: str,
                        _new_name: str):
-        for x in self:
-            x.rename_strings(_old_name, _new_name)
+        self.apply_renames({_old_name: _new_name})
 
     def to_l5x(self,
                controller_name: str,
@@ -131,46 +296,40 @@ class PylogixList[T](list):
             in the derived class"""
         if len(self) == 0:
             return
-        root, rslogix5000Content = l5x_content_wrapper(self.l5x_child_keyword,
-                                                       self[0].name,
-                                                       True,
-                                                       'References NoRawData L5KData DecoratedData Context Dependencies ForceProtectedEncoding AllProjDocTrans')
-        root.insertBefore(root.createComment(self[0].description), rslogix5000Content)
-        ctrl = generic_controller_wrapper(root,
-                                          controller_name,
-                                          'Context')
-        rslogix5000Content.appendChild(ctrl)
 
         dependencies = PyLogixDependencies()
         for obj in self:
-            dependencies.extend(obj.get_dependencies(include_root=True))
+            obj.get_dependencies(include_root=True,
+                                 _acc=dependencies)
         dependencies.sort()
 
-        dt_root = self.__to_l5x_xml_node__('DataTypes',
-                                           dependencies.datatypes,
-                                           root,
-                                           True if self.l5x_keyword == 'DataTypes' else False,
-                                           include_dependencies)
-        if dt_root:
-            ctrl.appendChild(dt_root)
-
-        aoi_root = self.__to_l5x_xml_node__('AddOnInstructionDefinitions',
-                                            dependencies.add_on_instructions,
-                                            root,
-                                            True if self.l5x_keyword == 'AddOnInstructionDefinitions' else False,
-                                            include_dependencies)
-        if aoi_root:
-            ctrl.appendChild(aoi_root)
-
-        write_xml_to_l5x(root,
-                         save_location)
+        content_attributes = l5x_content_attributes(self.l5x_child_keyword,
+                                                    self[0].name,
+                                                    True,
+                                                    L5X_CONTEXT_EXPORT_OPTIONS)
+        with l5x_stream_writer(save_location,
+                               content_attributes,
+                               controller_name,
+                               'Context',
+                               self[0].description) as xf:
+            as_target = True if self.l5x_keyword == 'DataTypes' else False
+            write_l5x_stream_group(xf,
+                                   'DataTypes',
+                                   (dt.to_l5x_xml_node(as_target=as_target,
+                                                       include_dependencies=include_dependencies)
+                                    for dt in dependencies.datatypes))
+
+            as_target = True if self.l5x_keyword == 'AddOnInstructionDefinitions' else False
+            write_l5x_stream_group(xf,
+                                   'AddOnInstructionDefinitions',
+                                   (aoi.to_l5x_xml_node(as_target=as_target,
+                                                        include_dependencies=include_dependencies)
+                                    for aoi in dependencies.add_on_instructions))
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
+                        include_dependencies: bool = False) -> etree._Element:
         return self.__to_l5x_xml_node__(self.l5x_keyword,
                                         self,
-                                        root,
                                         as_target,
                                         include_dependencies)
@@ -5,15 +5,58 @@
     """
 
 # pylogix imports #
-from l5x import write_xml_to_l5x, generic_controller_wrapper, l5x_content_wrapper
+from l5x import l5x_content_attributes, l5x_stream_writer, write_l5x_stream_group, L5X_CONTEXT_EXPORT_OPTIONS
 from base.pylogix_dependencies import PyLogixDependencies
 from base.pylogix_enum import DescriptionPropertyIdentifier
 
 # python std lib imports #
-from copy import deepcopy
+from copy import copy, deepcopy
 import re
+import sys
 from typing import Self, Type
-from xml.dom import minidom
+
+# 3rd party imports #
+from lxml import etree
+
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, frozenset, type(None))
+_BAD_NAME_CHARS = frozenset(['.', ',', '-', '/', '\\', '!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '=', '+', ' '])
+_TRAILING_DIGITS = re.compile(r'\d+$')
+_PROPERTY_PATTERNS: {(str, str): re.Pattern} = {}  # compiled property patterns keyed by (begin_char, end_char)
+
+
+def _abstract(cls: type,
+              name: str) -> NotImplementedError:
+    """ build the error raised by an abstract pylogix member that an inheriting class did not override
+    """
+    return NotImplementedError(f'{cls.__name__} must override {name} (required for l5x files)')
+
+
+def _fast_copy(value,
+               memo: {}):
+    """ deep copy a value, specialized for what pylogix objects usually hold\n
+        immutables are shared, plain containers are rebuilt directly and pylogix objects use their own __deepcopy__.
+        anything else falls back to copy.deepcopy
+        """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    _copy = memo.get(id(value))
+    if _copy is not None:
+        return _copy
+    value_type = type(value)
+    if value_type is list:
+        _copy = memo[id(value)] = []
+        _copy.extend(_fast_copy(x, memo) for x in value)
+        return _copy
+    if value_type is dict:
+        _copy = memo[id(value)] = {}
+        for key, item in value.items():
+            _copy[key] = _fast_copy(item, memo)
+        return _copy
+    if value_type is tuple:
+        return tuple(_fast_copy(x, memo) for x in value)
+    if isinstance(value, PyLogixObject):
+        return value.__deepcopy__(memo)
+    return deepcopy(value, memo)
 
 
 class DescriptionProperties:
@@ -21,11 +64,17 @@ class DescriptionProperties:
         these properties exist in the 'description' of each pylogix_object\n
         this is managed in Allen Bradley's Studio 5000 software as Descriptions as well.
     """
-    identifier: str | None = None  # Logic object ID (e.g. 'CONTROLLER' or 'PROGRAM')
-    type: str | None = None  # Logic object type (e.g. 'CPU' or 'ZONE')
-    version: str | None = None  # Logic object version
-    description: str | None = None  # Logic object description
-    editable: bool | None = None  # Logic object user editable
+    __slots__ = ('identifier', 'type', 'version', 'description', 'editable')
+
+    def __init__(self):
+        self.identifier: str | None = None  # Logic object ID (e.g. 'CONTROLLER' or 'PROGRAM')
+        self.type: str | None = None  # Logic object type (e.g. 'CPU' or 'ZONE')
+        self.version: str | None = None  # Logic object version
+        self.description: str | None = None  # Logic object description
+        self.editable: bool | None = None  # Logic object user editable
+
+    def __values__(self) -> tuple:
+        return self.identifier, self.type, self.version, self.description, self.editable
 
     @classmethod
     def get_properties(cls,
@@ -37,20 +86,21 @@ class DescriptionProperties:
             return props
         ident = DescriptionPropertyIdentifier.from_string(description_properties[0])
         props.identifier = ident.value if ident else ''
-        props.type = cls.parse_from_property(description_properties, '@TYPE')
-        props.version = cls.parse_from_property(description_properties, '@VERSION')
-        props.description = cls.parse_from_property(description_properties, '@DESC')
-        props.editable = False if '@NOEDITS' in description_properties else True
+        props.editable = True
+        for prop in description_properties:  # single pass, first match of each property wins
+            if prop.startswith('@TYPE'):
+                if props.type is None:
+                    props.type = sys.intern(prop[5:].strip())  # a handful of types, compared and grouped on
+            elif prop.startswith('@VERSION'):
+                if props.version is None:
+                    props.version = prop[8:].strip()
+            elif prop.startswith('@DESC'):
+                if props.description is None:
+                    props.description = prop[5:].strip()
+            elif prop == '@NOEDITS':
+                props.editable = False
         return props
 
-    @staticmethod
-    def parse_from_property(desc_props: [str],
-                            property_to_find: str) -> str:
-        """ return a specified property from a description list
-        """
-        return next(
-            (str(prop).replace(property_to_find, '').strip() for prop in desc_props if property_to_find in prop), None)
-
 
 class PyLogixObject(object):
     """
@@ -59,7 +109,19 @@ class PyLogixObject(object):
     call with a name and [optional] description
     this object shall not be used directly and instead, inherited by other classes
     to be used in the pylogix ecosystem
+
+    base attributes are stored in __slots__. inheriting classes should declare their own __slots__
+    (even an empty tuple) to keep instances free of a per-instance __dict__
     """
+    __slots__ = ('_name', 'description', 'description_properties', '_parsed_state', '_generator_properties',
+                 '_data')
+    renames: int = 0  # counts renames, so name indexed lists know when a lookup miss may be out of date
+    l5x_dependency_groups: ((str, str),) = (('datatypes', 'DataTypes'),
+                                            ('modules', 'Modules'),
+                                            ('add_on_instructions', 'AddOnInstructionDefinitions'),
+                                            ('tags', 'Tags'),
+                                            ('programs', 'Programs'),
+                                            ('tasks', 'Tasks'))  # (dependency bucket, l5x group node) in export order
 
     def __init__(self,
                  name: str,
@@ -69,41 +131,88 @@ class PyLogixObject(object):
         self._name = name
         self.description = description
         self.description_properties = DescriptionProperties()
+        self._parsed_state: tuple | None = None  # (description, description property values) as of the last parse
         self._generator_properties: [str] = []
         self._data = {}
 
     def __copy__(self) -> Self:
-        """ shallow copy of an object
-        """
-        _copy = type(self)(self.name,
-                           self.description)
-        _copy.__dict__.update(self.__dict__)
+        """ shallow copy of an object\n
+            the copy is created without calling __init__ (all of its state is copied over anyway)
+            """
+        cls = type(self)
+        _copy = cls.__new__(cls)
+        for key, value in self.__state_items__():
+            setattr(_copy, key, value)
         return _copy
 
     def __deepcopy__(self,
                      memo) -> Self:  # memo is a dict of id's to copies
-        """ deep copy of an object
-        """
+        """ deep copy of an object\n
+            the copy is created without calling __init__ (all of its state is copied over anyway)
+            and attribute values are copied through _fast_copy rather than the generic deepcopy dispatch
+            """
         id_self = id(self)  # memoization avoids unnecessary recursion
         _copy = memo.get(id_self)
-        if _copy is None:
-            _copy = type(self)(
-                deepcopy(self.name, memo),
-                deepcopy(self.description, memo))
-            memo[id_self] = _copy
-            for key, value in self.__dict__.items():
-                setattr(_copy, key, deepcopy(value, memo))
+        if _copy is not None:
+            return _copy
+
+        cls = type(self)
+        _copy = cls.__new__(cls)
+        memo[id_self] = _copy
+        for key, value in self.__state_items__():
+            setattr(_copy, key, _fast_copy(value, memo))
         return _copy
 
+    def clone(self) -> Self:
+        """ copy this object for editing\n
+            a shallow copy that owns its description properties, generator properties and data containers.
+            override to also copy the containers an inheriting class edits in place
+            (much cheaper than deepcopy when only this object's own fields will change)
+            """
+        _clone = self.__copy__()
+        _clone.description_properties = copy(self.description_properties)
+        _clone._generator_properties = list(self._generator_properties)
+        _clone._data = dict(self._data)
+        return _clone
+
     def __eq__(self,
                other: Self) -> bool:
         """ test equality
 
         uses self.name to test
         """
-        if not other:
-            return False
-        return True if self.name == other.name else False
+        if self is other:
+            return True
+        if not isinstance(other, PyLogixObject):
+            return NotImplemented
+        return self._name == other._name
+
+    __hash__ = None  # equality is by (mutable) name, so objects are not hashable. key sets / dicts by name or id()
+
+    @staticmethod
+    def __apply_renames__(string: str | None,
+                          mapping: {str: str}) -> str | None:
+        """ replace every key of mapping found in string with its value, one rename after another in mapping order
+        """
+        if not string or not mapping:
+            return string
+        return PyLogixObject.__renamer__(mapping)(string)
+
+    @staticmethod
+    def __renamer__(mapping: {str: str}) -> callable:
+        """ build a function that applies every rename of mapping to a string\n
+            mapping is a dict or an ordered sequence of (old, new) pairs (in which an old name may repeat).
+            renames are applied one after another in mapping order, so chained renames carry through
+            (e.g. {'A': 'B', 'B': 'C'} turns 'A' into 'C')
+            """
+        renames = tuple(mapping.items()) if isinstance(mapping, dict) else tuple(mapping)
+
+        def rename(string: str) -> str:
+            for old_name, new_name in renames:
+                string = string.replace(old_name, new_name)
+            return string
+
+        return rename
 
     def __getitem__(self, item):
         return self._data[item]
@@ -118,22 +227,30 @@ class PyLogixObject(object):
             pass
         return True
 
-    def __resolve_dependencies_to_xml_node__(self,
-                                             dependency_list: [],
-                                             node_name: str,
-                                             root: minidom.Document) -> minidom.Element | None:
-        """ resolve a list of dependencies into an xml node
+    def __stream_dependencies__(self,
+                                xf: etree.xmlfile,
+                                dependency_list: [],
+                                node_name: str) -> None:
+        """ stream a list of dependencies as a group node through an l5x stream writer
         """
         if len(dependency_list) <= 0:
-            return None
+            return
 
-        _node = root.createElement(node_name)
-        _node.setAttribute('Use', 'Context')
-        for depend in dependency_list:
-            _node.appendChild(depend.to_l5x_xml_node(root,
-                                                     True if depend is self else False,
-                                                     True))
-        return _node
+        write_l5x_stream_group(xf,
+                               node_name,
+                               (depend.to_l5x_xml_node(depend is self,
+                                                       True) for depend in dependency_list),
+                               {'Use': 'Context'})
+
+    def __state_items__(self):
+        """ yield (attribute, value) pairs for this object's state\n
+            covers the instance __dict__ as well as any __slots__ declared by inheriting classes
+            """
+        yield from getattr(self, '__dict__', {}).items()
+        for klass in type(self).__mro__:
+            for slot in klass.__dict__.get('__slots__', ()):
+                if hasattr(self, slot):
+                    yield slot, getattr(self, slot)
 
     def __setitem__(self, key, value):
         self._data[key] = value
@@ -147,11 +264,11 @@ class PyLogixObject(object):
 
     @property
     def l5x_node_name(self):
-        raise NotImplementedError('inheriting class must override this property with reflecting name for l5x files.')
+        raise _abstract(type(self), 'l5x_node_name')
 
     @property
     def l5x_parent_node_name(self):
-        raise NotImplementedError('inheriting class must override this property with reflecting name for l5x files.')
+        raise _abstract(type(self), 'l5x_parent_node_name')
 
     @property
     def name(self):
@@ -160,11 +277,11 @@ class PyLogixObject(object):
     @name.setter
     def name(self,
              value: str):
-        bad_vals = ['.', ',', '-', '/', '\\', '!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '=', '+', ' ']
-        if any(x in value for x in bad_vals):
+        if not _BAD_NAME_CHARS.isdisjoint(value):
             raise ValueError("illegal name set!")
         if self.__on_new_name__(value):
             self._name = value
+            PyLogixObject.renames += 1
 
     @classmethod
     def from_l5x(cls,
@@ -174,26 +291,28 @@ class PyLogixObject(object):
         """ abstract implementation of from_l5x method\n
             to implement, compile cls from passed l5x_node\n
             in the derived class"""
-        raise NotImplementedError(
-            'inheriting class must override this property with reflecting function for l5x files.')
+        raise _abstract(cls, 'from_l5x')
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
         """ abstract implementation of from_l5x method\n
                     to implement, compile cls from passed l5x_node\n
                     in the derived class"""
-        raise NotImplementedError(
-            'inheriting class must override this property with reflecting function for l5x files.')
+        raise _abstract(cls, 'from_l5x_xml_node')
 
     def get_dependencies(self,
-                         include_root: bool = False) -> PyLogixDependencies:
+                         include_root: bool = False,
+                         *,
+                         _acc: PyLogixDependencies | None = None) -> PyLogixDependencies:
         """ abstract implementation of cla get_dependencies
             to implement, return all logix objects this object relies on
-            in the derived class"""
-        raise NotImplementedError('inheriting class must override this property')
+            in the derived class\n
+            when _acc is supplied, add dependencies directly into it (and pass it on to children)
+            and return it, instead of allocating and merging a new PyLogixDependencies"""
+        raise _abstract(type(self), 'get_dependencies')
 
     def get_schema_options(self) -> {}:
         """ get schema options of object for l5x compilation
@@ -206,24 +325,20 @@ class PyLogixObject(object):
                         named_object: Type[Self],
                         list_to_search: [Self]):
         """ generate unique named based on the name of the object provided.
-            useful for creating new pylogix objects from others
+            useful for creating new pylogix objects from others\n
+            list_to_search may also be a pre-built set of names, so callers generating many names can reuse it
             """
-        results = re.search(r'\d+$', named_object.name)
-        try:
-            results_ctr = int(results.group()) if results else None
-        except ValueError:
-            results_ctr = None
+        names = list_to_search if isinstance(list_to_search, (set, frozenset)) else {thing.name for thing in
+                                                                                      list_to_search}
+        results = _TRAILING_DIGITS.search(named_object.name)
+        results_ctr = int(results.group()) if results else None
 
-        searching_name_base = named_object.name.replace(results.group(), '') if results_ctr else named_object.name
+        searching_name_base = named_object.name[:results.start()] if results_ctr else named_object.name
         counter = results_ctr if results_ctr else 1
-        searching_name = f'{searching_name_base}{counter}' if counter >= 10 else f'{searching_name_base}0{counter}'
-        while True:
-            name_match = next((thing for thing in list_to_search if thing.name == searching_name), None)
-            if name_match:
-                counter += 1
-                searching_name = f'{searching_name_base}{counter}' if counter >= 10 else f'{searching_name_base}0{counter}'
-            else:
-                break
+        searching_name = f'{searching_name_base}{counter:02d}'
+        while searching_name in names:
+            counter += 1
+            searching_name = f'{searching_name_base}{counter:02d}'
         return searching_name
 
     @classmethod
@@ -233,37 +348,26 @@ class PyLogixObject(object):
                                   begin_char: str = '<',
                                   end_char: str = '>') -> [str]:
         """ gather properties from a supplied string by matching begin_char to end_char.
-            will search recursively, returning a list of all matches
+            returns a list of all matches (appended to properties, if supplied)
             """
         if properties is None:
             properties = []
-        if not string:
-            return properties
-
-        find_begin = string.find(begin_char)
-        if find_begin == -1:
+        if not string or begin_char not in string:
             return properties
-        begin_anchor = find_begin + len(begin_char)
 
-        find_end = string.find(end_char, begin_anchor)
-        if find_end == -1:
-            return properties
-        end_anchor = begin_anchor + (find_end - len(end_char))
+        pattern = _PROPERTY_PATTERNS.get((begin_char, end_char))
+        if pattern is None:
+            pattern = re.compile(re.escape(begin_char) + r'(.*?)' + re.escape(end_char), re.DOTALL)
+            _PROPERTY_PATTERNS[(begin_char, end_char)] = pattern
 
-        if not properties:
-            properties = []
-        properties.append(string[begin_anchor:end_anchor].lstrip(begin_char).rstrip(end_char))
-
-        return cls.property_list_from_string(string[(begin_anchor + find_end):].lstrip(),
-                                             properties,
-                                             begin_char,
-                                             end_char)
+        properties.extend(pattern.findall(string))
+        return properties
 
     def push_updates(self,
                      other_obj: Self,
                      *args,
                      **kwargs) -> PyLogixDependencies:
-        raise NotImplementedError('This method must be overridden by the over-riding class')
+        raise _abstract(type(self), 'push_updates')
 
     def rebind(self,
                *args,
@@ -271,88 +375,72 @@ class PyLogixObject(object):
         """ rebind method for pylogix_object\n
         make sure to super() call this if it is overridden to get description properties automatically
         """
+        if self._parsed_state == (self.description, self.description_properties.__values__()):
+            return  # neither the description nor its properties changed since they were last parsed
         self.description_properties = DescriptionProperties.get_properties(
             self.property_list_from_string(self.description))
+        self._parsed_state = (self.description, self.description_properties.__values__())
+
+    def apply_renames(self,
+                      mapping: {str: str}):
+        """ rename every occurrence of each key of mapping to its value in this object's strings
+
+            mapping may also be an ordered sequence of (old, new) pairs, in which an old name can repeat.
+            renames are applied in mapping order. override (and super() call) this to rename child strings
+            """
+        if not mapping:
+            return
+        if self.name:
+            new_name = self.__apply_renames__(self.name, mapping)
+            if new_name != self.name:
+                self.name = new_name
+        if self.description:
+            self.description = self.__apply_renames__(self.description, mapping)
 
     def rename_strings(self,
                        _old_name: str,
                        _new_name: str):
-        if self.name:
-            self.name = self.name.replace(_old_name, _new_name)
-        if self.description:
-            self.description = self.description.replace(_old_name, _new_name)
+        self.apply_renames({_old_name: _new_name})
 
     def resolve_generator(self,
                           _generator_texts: [{}]):
-        for _text in _generator_texts:
-            self.rename_strings(_text['GeneratorText'],
-                                _text['NewText'])
+        self.apply_renames([(_text['GeneratorText'], _text['NewText']) for _text in _generator_texts])
 
     def to_l5x(self,
                controller_name: str,
                save_location: str) -> None:
-        export_options = self.get_schema_options()
-        root, rslogix5000Content = l5x_content_wrapper(self.l5x_node_name,
-                                                       self.name,
-                                                       True,
-                                                       'References NoRawData L5KData DecoratedData Context Dependencies ForceProtectedEncoding AllProjDocTrans',
-                                                       **export_options)
-        if self.description:
-            root.insertBefore(root.createComment(self.description), rslogix5000Content)
-
-        ctrl = generic_controller_wrapper(root,
-                                          controller_name,
-                                          'Context')
-        rslogix5000Content.appendChild(ctrl)
-
-        dependencies = PyLogixDependencies()
-        dependencies.extend(self.get_dependencies(include_root=True))
+        self.to_l5x_stream(controller_name,
+                           save_location)
+
+    def to_l5x_stream(self,
+                      controller_name: str,
+                      save_location: str) -> None:
+        """ write this object and its dependencies to an l5x file\n
+            each dependency group is streamed to disk as it is produced,
+            so only one dependency's xml node is held in memory at a time
+            """
+        dependencies = self.get_dependencies(include_root=True)
         dependencies.sort()
 
-        dt_node = self.__resolve_dependencies_to_xml_node__(dependencies.datatypes,
-                                                            'DataTypes',
-                                                            root)
-        if dt_node:
-            ctrl.appendChild(dt_node)
-
-        mod_node = self.__resolve_dependencies_to_xml_node__(dependencies.modules,
-                                                             'Modules',
-                                                             root)
-        if mod_node:
-            ctrl.appendChild(mod_node)
-
-        aoi_node = self.__resolve_dependencies_to_xml_node__(dependencies.add_on_instructions,
-                                                             'AddOnInstructionDefinitions',
-                                                             root)
-        if aoi_node:
-            ctrl.appendChild(aoi_node)
-
-        tags_node = self.__resolve_dependencies_to_xml_node__(dependencies.tags,
-                                                              'Tags',
-                                                              root)
-        if tags_node:
-            ctrl.appendChild(tags_node)
-
-        programs_node = self.__resolve_dependencies_to_xml_node__(dependencies.programs,
-                                                                  'Programs',
-                                                                  root)
-        if programs_node:
-            ctrl.appendChild(programs_node)
-
-        tasks_node = self.__resolve_dependencies_to_xml_node__(dependencies.tasks,
-                                                               'Tasks',
-                                                               root)
-        if tasks_node:
-            ctrl.appendChild(tasks_node)
-
-        write_xml_to_l5x(root,
-                         save_location)
+        content_attributes = l5x_content_attributes(self.l5x_node_name,
+                                                    self.name,
+                                                    True,
+                                                    L5X_CONTEXT_EXPORT_OPTIONS,
+                                                    **self.get_schema_options())
+        with l5x_stream_writer(save_location,
+                               content_attributes,
+                               controller_name,
+                               'Context',
+                               self.description) as xf:
+            for bucket, node_name in self.l5x_dependency_groups:
+                self.__stream_dependencies__(xf,
+                                             getattr(dependencies, bucket),
+                                             node_name)
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
+                        include_dependencies: bool = False) -> etree._Element:
         """ abstract implementation of to_l5x_xml_node
             to implement, create and write an xml node and return it
             in the derived class"""
-        raise NotImplementedError()
+        raise _abstract(type(self), 'to_l5x_xml_node')
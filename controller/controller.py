@@ -8,21 +8,44 @@
 # pylogix imports #
 from add_on_instruction import AddOnInstructionList
 from datatype import DataTypeList
-from l5x import get_text_data, get_first_element, bool_from_l5x, bool_to_l5x, open_l5x_to_controller_node, \
-    write_xml_to_l5x, l5x_content_wrapper
+from l5x import get_text_data, bool_to_l5x, bool_from_l5x, get_first_element, l5x_content_attributes, \
+    l5x_stream_document, write_l5x_stream_group, L5X_CONTEXT_EXPORT_OPTIONS, L5X_READ_BUFFER_SIZE
 from base import PyLogixObject, ExtendedEnum, PyLogixDependencies, LogixTagType
 from module import ModuleList
 from program import Program, ProgramList
-from tag import Tag, TagList
+from tag import TagList
 from task import TaskList
 
 # python std lib imports #
-from copy import copy
+from itertools import chain
 from typing import Callable, Self
-from xml.dom import minidom
+
+# 3rd party imports #
+from lxml import etree
+
+
+def _ancillary_l5x_nodes() -> (etree._Element,):
+    """ build the constant ancillary controller nodes written after the controller's sections
+    """
+    ethernet_ports = etree.Element('EthernetPorts')
+    etree.SubElement(ethernet_ports, 'EthernetPort', attrib={'Port': '1',
+                                                             'Label': '1',
+                                                             'PortEnable': 'true'})
+    return (etree.Element('CST', attrib={'MasterID': '0'}),
+            etree.Element('WallClockTime', attrib={'LocalTimeAdjustment': '0',
+                                                   'TimeZone': '0'}),
+            etree.Element('TimeSynchronize', attrib={'Priority1': '128',
+                                                     'Priority2': '128',
+                                                     'PTPEnable': 'true'}),
+            ethernet_ports)
+
+
+_ANCILLARY_L5X_NODES = _ancillary_l5x_nodes()  # built once, only ever serialized
 
 
 class ControllerRedundancyInfo(PyLogixObject):
+    __slots__ = ('enabled', 'keep_test_edits_on_switch_over')
+
     def __init__(self,
                  enabled: bool = True,
                  keep_test_edits_on_switch_over: bool = True):
@@ -33,26 +56,26 @@ class ControllerRedundancyInfo(PyLogixObject):
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           class_constructor: type[Self] | None = None,
                           *args,
                           **kwargs):
-        if not xml_node:
+        if xml_node is None:
             return None
-        return cls(True if xml_node.getAttribute('Enabled') == 'true' else False,
-                   True if xml_node.getAttribute('KeepTestEditsOnSwitchOver') == 'true' else False)
+        return cls(bool_from_l5x(xml_node.get('Enabled')),
+                   bool_from_l5x(xml_node.get('KeepTestEditsOnSwitchOver')))
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        redundancy_root = root.createElement('RedundancyInfo')
-        redundancy_root.setAttribute('Enabled', bool_to_l5x(self.enabled))
-        redundancy_root.setAttribute('KeepTestEditsOnSwitchOver', bool_to_l5x(self.keep_test_edits_on_switch_over))
-        return redundancy_root
+                        include_dependencies: bool = False) -> etree._Element:
+        return etree.Element('RedundancyInfo',
+                             attrib={'Enabled': bool_to_l5x(self.enabled),
+                                     'KeepTestEditsOnSwitchOver': bool_to_l5x(self.keep_test_edits_on_switch_over)})
 
 
 class ControllerSecurity(PyLogixObject):
+    __slots__ = ('code', 'changes_to_detect')
+
     def __init__(self,
                  code: int = 0,
                  changes_to_detect: str = ''):
@@ -63,26 +86,27 @@ class ControllerSecurity(PyLogixObject):
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           class_constructor: type[Self] | None = None,
                           *args,
                           **kwargs):
-        if not xml_node:
+        if xml_node is None:
             return None
-        return cls(int(xml_node.getAttribute('Code')),
-                   xml_node.getAttribute('ChangesToDetect'))
+        return cls(int(xml_node.get('Code', '')),
+                   xml_node.get('ChangesToDetect', ''))
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        security_root = root.createElement('Security')
-        security_root.setAttribute('Code', '0' if not self.code else self.code)
-        security_root.setAttribute('ChangesToDetect', self.changes_to_detect)
-        return security_root
+                        include_dependencies: bool = False) -> etree._Element:
+        return etree.Element('Security',
+                             attrib={'Code': str(self.code or 0),
+                                     'ChangesToDetect': self.changes_to_detect})
 
 
 class ControllerSafetyInfo(PyLogixObject):
+    __slots__ = ('safety_signature', 'safety_locked', 'signature_runmode_protect', 'configure_safe_io_always',
+                 'safety_level', 'safety_lock_password', 'safety_unlock_password', 'safety_tag_map')
+
     class SafetyLevel(ExtendedEnum):
         sil2 = r'SIL2/PLd'
 
@@ -107,45 +131,60 @@ class ControllerSafetyInfo(PyLogixObject):
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           class_constructor: type[Self] | None = None,
                           *args,
                           **kwargs):
-        if not xml_node:
+        if xml_node is None:
             return None
-        return cls(xml_node.getAttribute('SafetySignature'),
-                   True if xml_node.getAttribute('SafetyLocked') == 'true' else False,
-                   bool_from_l5x(xml_node.getAttribute('SignatureRunModeProtect')),
-                   bool_from_l5x(xml_node.getAttribute('ConfigureSafetyIOAlways')),
-                   cls.SafetyLevel.from_string(xml_node.getAttribute('SafetyLevel')),
-                   xml_node.getAttribute('SafetyLockPassword'),
-                   xml_node.getAttribute('SafetyUnlockPassword'))
+        ga = dict(xml_node.attrib).get  # one attribute pull, then plain dict lookups
+        return cls(ga('SafetySignature', ''),
+                   bool_from_l5x(ga('SafetyLocked')),
+                   bool_from_l5x(ga('SignatureRunModeProtect')),
+                   bool_from_l5x(ga('ConfigureSafetyIOAlways')),
+                   cls.SafetyLevel.from_string(ga('SafetyLevel', '')),
+                   ga('SafetyLockPassword', ''),
+                   ga('SafetyUnlockPassword', ''))
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        safety_root = root.createElement('SafetyInfo')
+                        include_dependencies: bool = False) -> etree._Element:
+        attributes = {}
         if self.safety_signature:
-            safety_root.setAttribute('SafetySignature', self.safety_signature)
-        safety_root.setAttribute('SafetyLocked', bool_to_l5x(self.safety_locked))
+            attributes['SafetySignature'] = self.safety_signature
+        attributes['SafetyLocked'] = bool_to_l5x(self.safety_locked)
         if self.safety_lock_password:
-            safety_root.setAttribute('SafetyLockPassword', self.safety_lock_password)
+            attributes['SafetyLockPassword'] = self.safety_lock_password
         if self.safety_unlock_password:
-            safety_root.setAttribute('SafetyUnlockPassword', self.safety_unlock_password)
-        safety_root.setAttribute('SignatureRunModeProtect', bool_to_l5x(self.signature_runmode_protect))
-        safety_root.setAttribute('ConfigureSafetyIOAlways', bool_to_l5x(self.configure_safe_io_always))
-        safety_root.setAttribute('SafetyLevel', self.safety_level.value)
+            attributes['SafetyUnlockPassword'] = self.safety_unlock_password
+        attributes['SignatureRunModeProtect'] = bool_to_l5x(self.signature_runmode_protect)
+        attributes['ConfigureSafetyIOAlways'] = bool_to_l5x(self.configure_safe_io_always)
+        attributes['SafetyLevel'] = self.safety_level.value
+        safety_root = etree.Element('SafetyInfo',
+                                    attrib=attributes)
         if len(self.safety_tag_map) > 0:
-            safety_tag_map = root.createElement('SafetyTagMap')
-            safety_tag_map.appendChild(root.createTextNode(', '.join(self.safety_tag_map)))
-            safety_root.appendChild(safety_tag_map)
+            safety_tag_map = etree.SubElement(safety_root, 'SafetyTagMap')
+            safety_tag_map.text = ', '.join(self.safety_tag_map)
         return safety_root
 
 
 class Controller(PyLogixObject):
     """ pylogix allen bradley logix controller
     """
+    __slots__ = ('controller_type', 'major_rev', 'minor_rev', 'sfc_execution_ctrl', 'sfc_restart_pos', 'sfc_last_scan',
+                 'comm_path', 'redundancy_info', 'security_info', 'safety_info', 'project_sn',
+                 'match_project_to_controller', 'can_use_rpi_from_producer', 'inhibit_automatic_firmware_update',
+                 'pass_through_configuration', 'download_extended_properties', 'download_custom_properties',
+                 'report_minor_overflow', 'datatypes', 'modules', 'add_on_instructions', 'tags', 'programs', 'tasks',
+                 'on_add')
+    l5x_node_name = 'Controller'
+    l5x_sections: ((str, type),) = (('datatypes', DataTypeList),
+                                    ('modules', ModuleList),
+                                    ('add_on_instructions', AddOnInstructionList),
+                                    ('tags', TagList),
+                                    ('programs', ProgramList),
+                                    ('tasks', TaskList))  # (controller attribute, list type) in l5x order
+    _section_by_type: {type: str} = {list_type._ctor_type: key for key, list_type in l5x_sections}
 
     class ControllerType(ExtendedEnum):
         l82es = '1756-L82ES'
@@ -215,73 +254,32 @@ class Controller(PyLogixObject):
         """
         self.on_add: [Callable] = []
 
-    @property
-    def l5x_node_name(self):
-        return 'Controller'
-
     def __on_add__(self, obj: PyLogixObject):
         for callback in self.on_add:
             callback(obj)
 
     def __resolve_tag_aliases__(self,
                                 dependencies: PyLogixDependencies):
-        for tag in [t for t in dependencies.tags if t.alias_for is not None and t.alias_for != '']:
-            new_tag: Tag = copy(tag)
-            new_tag.alias_for = None
-            new_tag.name = tag.alias_for
-            new_tag.tag_type = LogixTagType.base
-            new_tag.datatype = next((x for x in self.datatypes if x.name == new_tag.datatype_meta_name), None)
-            self.tags.append(new_tag,
+        for tag in dependencies.tags:
+            if not tag.alias_for:
+                continue
+            self.tags.append(tag.fast_clone(name=tag.alias_for,
+                                            tag_type=LogixTagType.base,
+                                            datatype=self.datatypes.by_name(tag.datatype_meta_name)),
                              True)
-        return
-
-    @staticmethod
-    def __safe_add__(obj: object, lst: []) -> bool:
-        """ safely add an object into a list based on presence in list
-            :param obj: object to add to controller. must be a controller-type object
-            :param lst: list to add object to
-            :returns: boolean of success
-                """
-        if obj not in lst:
-            lst.append(obj)
-            return True
-        return False
-
-    @staticmethod
-    def __safe_remove__(obj: object, lst: []) -> bool:
-        """ safely add an object into a list based on presence in list
-            :param obj: object to be removed
-            :param lst: list to remove object from
-            :returns: boolean of success
-                """
-        if obj in lst:
-            lst.remove(obj)
-            return True
-        return False
 
     def all_objects(self) -> []:
-        return self.datatypes + self.modules + self.add_on_instructions + self.tags + self.programs + self.tasks
+        return list(chain.from_iterable(getattr(self, key) for key, _ in self.l5x_sections))
 
     def append(self,
                obj: PyLogixObject) -> bool:
-        """ dynamically append object to controller based on match case
+        """ dynamically append object to controller based on object type
         :param obj: object to append to controller
         :returns: boolean of success
         """
-
-        match type(obj):
-            case self.datatypes.object_constructor_type:
-                return self.datatypes.append(obj)
-            case self.modules.object_constructor_type:
-                return self.modules.append(obj)
-            case self.add_on_instructions.object_constructor_type:
-                return self.add_on_instructions.append(obj)
-            case self.tags.object_constructor_type:
-                return self.tags.append(obj)
-            case self.programs.object_constructor_type:
-                return self.programs.append(obj)
-            case self.tasks.object_constructor_type:
-                return self.tasks.append(obj)
+        section = self._section_by_type.get(type(obj))
+        if section is not None:
+            return getattr(self, section).append(obj)
         raise TypeError(f'object {obj.__name__} could not be appended to the controller!\n'
                         f'Validate the object is a controller object!')
 
@@ -289,12 +287,46 @@ class Controller(PyLogixObject):
     def clone_to_new_controller(cls, existing_controller: type[Self]) -> Self:
         raise NotImplementedError('not yet...')
 
+    @classmethod
+    def __from_l5x_controller_node__(cls,
+                                     constructor: type[Self],
+                                     controller_node: etree._Element) -> Self:
+        """ construct a controller (without any of its object lists) from its l5x node
+        """
+        if controller_node.getroottree().getroot().tag != 'RSLogix5000Content':
+            raise ValueError('incorrect file received. Could not located RSLogix5000Content')
+        ga = dict(controller_node.attrib).get  # one attribute pull, then plain dict lookups
+        return constructor(ga('Name', ''),
+                           get_text_data(controller_node, 'Description'),
+                           cls.ControllerType.from_string(ga('ProcessorType', '')),
+                           int(ga('MajorRev', '')),
+                           int(ga('MinorRev', '')),
+                           cls.SFCExecutionControl.from_string(ga('SFCExecutionControl', '')),
+                           cls.SFCRestartPosition.from_string(ga('SFCRestartPosition', '')),
+                           cls.SFCLastScan.from_string(ga('SFCLastScan', '')),
+                           ga('CommPath', ''),
+                           ControllerRedundancyInfo.from_l5x_xml_node(
+                               get_first_element(controller_node, 'RedundancyInfo')),
+                           ControllerSecurity.from_l5x_xml_node(get_first_element(controller_node, 'Security')),
+                           ControllerSafetyInfo.from_l5x_xml_node(
+                               get_first_element(controller_node, 'SafetyInfo')),
+                           ga('ProjectSN', ''),
+                           bool_from_l5x(ga('MatchProjectToController')),
+                           bool_from_l5x(ga('CanUseRPIFromProducer')),
+                           int(ga('InhibitAutomaticFirmwareUpdate', '')),
+                           cls.LogixPassThroughConfiguration.from_string(ga('PassThroughConfiguration', '')),
+                           bool_from_l5x(ga('DownloadProjectDocumentationAndExtendedProperties')),
+                           bool_from_l5x(ga('DownloadProjectCustomProperties')),
+                           bool_from_l5x(ga('ReportMinorOverflow')))
+
     @classmethod
     def from_l5x(cls,
                  l5x_path: str,
                  *args,
                  **kwargs) -> Self | None:
-        """ create a controller object (or supplied type class) from a l5x node
+        """ create a controller object (or supplied type class) from a l5x node\n
+        the file is parsed once, as a stream. each controller scoped object is constructed as soon as its node
+        has been read, then the node (and its already processed siblings) is cleared
         :param l5x_path: l5x path to parse and create controller object from
         :type l5x_path: str
         :param class_constructor: class to create controller objects from
@@ -304,70 +336,59 @@ class Controller(PyLogixObject):
         if not l5x_path:
             return None
 
-        controller_node = open_l5x_to_controller_node(l5x_path)
         try:
             constructor = kwargs['constructor'] if kwargs['constructor'] else cls
         except KeyError:
             constructor = cls
 
-        controller = constructor(controller_node.getAttribute('Name'),
-                                 get_text_data(controller_node, 'Description'),
-                                 cls.ControllerType.from_string(controller_node.getAttribute('ProcessorType')),
-                                 int(controller_node.getAttribute('MajorRev')),
-                                 int(controller_node.getAttribute('MinorRev')),
-                                 cls.SFCExecutionControl.from_string(
-                                     controller_node.getAttribute('SFCExecutionControl')),
-                                 cls.SFCRestartPosition.from_string(
-                                     controller_node.getAttribute('SFCRestartPosition')),
-                                 cls.SFCLastScan.from_string(controller_node.getAttribute('SFCLastScan')),
-                                 controller_node.getAttribute('CommPath'),
-                                 ControllerRedundancyInfo.from_l5x_xml_node(
-                                     get_first_element(controller_node, 'RedundancyInfo')),
-                                 ControllerSecurity.from_l5x_xml_node(get_first_element(controller_node, 'Security')),
-                                 ControllerSafetyInfo.from_l5x_xml_node(
-                                     get_first_element(controller_node, 'SafetyInfo')),
-                                 controller_node.getAttribute('ProjectSN'),
-                                 bool_from_l5x(controller_node.getAttribute('MatchProjectToController')),
-                                 bool_from_l5x(controller_node.getAttribute('CanUseRPIFromProducer')),
-                                 int(controller_node.getAttribute('InhibitAutomaticFirmwareUpdate')),
-                                 cls.LogixPassThroughConfiguration.from_string(
-                                     controller_node.getAttribute('PassThroughConfiguration')),
-                                 bool_from_l5x(controller_node.getAttribute(
-                                     'DownloadProjectDocumentationAndExtendedProperties')),
-                                 bool_from_l5x(controller_node.getAttribute('DownloadProjectCustomProperties')),
-                                 bool_from_l5x(controller_node.getAttribute('ReportMinorOverflow')))
-
-        kwargs['controller'] = controller
-        kwargs['ctrl_node'] = controller_node
-
-        controller.datatypes.from_l5x(l5x_path,
-                                      **kwargs)
-
-        kwargs['datatypes'] = controller.datatypes
-
-        controller.modules.from_l5x(l5x_path,
-                                    **kwargs)
-
-        kwargs['modules'] = controller.modules
-
-        controller.add_on_instructions.from_l5x(l5x_path,
-                                                **kwargs)
-
-        kwargs['add_on_instructions'] = controller.add_on_instructions
-
-        controller.tags.from_l5x(l5x_path,
-                                 **kwargs)
-
-        kwargs['tags'] = controller.tags
-
-        controller.programs.from_l5x(l5x_path,
-                                     **kwargs)
-
-        kwargs['programs'] = controller.programs
-
-        controller.tasks.from_l5x(l5x_path,
-                                  **kwargs)
-
+        sections = {list_type.l5x_keyword: (index, key) for index, (key, list_type) in enumerate(cls.l5x_sections)}
+        children = {list_type.l5x_child_keyword: list_type.l5x_keyword for _, list_type in cls.l5x_sections}
+        controller = None
+
+        with open(l5x_path, 'rb', buffering=L5X_READ_BUFFER_SIZE) as l5x_file:
+            for event, elem in etree.iterparse(l5x_file,
+                                               events=('start', 'end'),
+                                               tag=('Controller', *sections, *children),
+                                               huge_tree=True):
+                parent = elem.getparent()
+                if parent is None:
+                    continue
+
+                if event == 'start':
+                    if elem.tag not in sections or parent.tag != 'Controller':
+                        continue
+                    if controller is None:  # everything ahead of the first section has been read by now
+                        controller = cls.__from_l5x_controller_node__(constructor, parent)
+                        kwargs['controller'] = controller
+                    index, _ = sections[elem.tag]
+                    for key, _ in cls.l5x_sections[:index]:  # earlier sections are complete (or absent)
+                        kwargs[key] = getattr(controller, key)
+                    continue
+
+                if elem.tag == 'Controller':
+                    if controller is None:
+                        controller = cls.__from_l5x_controller_node__(constructor, elem)
+                    continue
+
+                section = children.get(elem.tag)
+                if section is not None and parent.tag == section:
+                    grandparent = parent.getparent()
+                    if grandparent is None or grandparent.tag != 'Controller':
+                        continue
+                    getattr(controller, sections[section][1]).append_from_l5x_xml_node(elem,
+                                                                                        **kwargs)
+                elif elem.tag in sections and parent.tag == 'Controller':
+                    _, key = sections[elem.tag]
+                    getattr(controller, key).rebind(**kwargs)
+                else:
+                    continue
+
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+        if controller is None:
+            raise ValueError('could not locate controller node. incorrect file received.')
         controller.rebind()
         return controller
 
@@ -403,24 +424,13 @@ class Controller(PyLogixObject):
 
     def remove(self,
                obj: PyLogixObject) -> bool:
-        """ dynamically remove object from controller based on match case
+        """ dynamically remove object from controller based on object type
         :param obj: object to remove from controller
         :returns: boolean of success
         """
-
-        match type(obj):
-            case self.datatypes.object_constructor_type:
-                return self.datatypes.remove(obj)
-            case self.modules.object_constructor_type:
-                return self.modules.remove(obj)
-            case self.add_on_instructions.object_constructor_type:
-                return self.add_on_instructions.remove(obj)
-            case self.tags.object_constructor_type:
-                return self.tags.remove(obj)
-            case self.programs.object_constructor_type:
-                return self.programs.remove(obj)
-            case self.tasks.object_constructor_type:
-                return self.tasks.remove(obj)
+        section = self._section_by_type.get(type(obj))
+        if section is not None:
+            return getattr(self, section).remove(obj)
         raise TypeError(f'object {obj.__name__} could not be removed from the controller!\n'
                         f'Validate the object is a controller object!')
 
@@ -451,103 +461,68 @@ class Controller(PyLogixObject):
     def to_l5x(self,
                controller_name: str,
                save_location: str) -> None:
-        export_options = self.get_schema_options()
-        root, rslogix5000Content = l5x_content_wrapper(self.l5x_node_name,
-                                                       self.name,
-                                                       True,
-                                                       'References NoRawData L5KData DecoratedData Context Dependencies ForceProtectedEncoding AllProjDocTrans',
-                                                       **export_options)
-        ctrl = self.to_l5x_xml_node(root,
-                                    True)
-        rslogix5000Content.appendChild(ctrl)
-
-        """ generate description
+        """ write this controller to an l5x file\n
+        the file is streamed: each section (and each object in it) is serialized and released as it is produced
         """
-        if self.description:  # append description if exists
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            desc_root.appendChild(root.createTextNode(''))
-            ctrl.appendChild(desc_root)
-
-        """ generate redundancy info
+        content_attributes = l5x_content_attributes(self.l5x_node_name,
+                                                    self.name,
+                                                    True,
+                                                    L5X_CONTEXT_EXPORT_OPTIONS,
+                                                    **self.get_schema_options())
+        with l5x_stream_document(save_location,
+                                 content_attributes,
+                                 self.__l5x_attributes__(True)) as xf:
+            if self.description:  # append description if exists
+                desc_root = etree.Element('Description')
+                desc_root.text = etree.CDATA(self.description)
+                xf.write(desc_root, pretty_print=True)
+
+            for info in (self.redundancy_info, self.security_info, self.safety_info):
+                if info:
+                    xf.write(info.to_l5x_xml_node(), pretty_print=True)
+
+            for key, _ in self.l5x_sections:
+                objects = getattr(self, key)
+                write_l5x_stream_group(xf,
+                                       objects.l5x_keyword,
+                                       (obj.to_l5x_xml_node() for obj in objects))
+
+            # write anscillary data
+            for node in _ANCILLARY_L5X_NODES:
+                xf.write(node, pretty_print=True)
+
+    def __l5x_attributes__(self,
+                           as_target: bool = False) -> {str: str}:
+        """ build the attribute dictionary of this controller's l5x node
         """
-        if self.redundancy_info:
-            ctrl.appendChild(self.redundancy_info.to_l5x_xml_node(root))
-
-        if self.security_info:
-            ctrl.appendChild(self.security_info.to_l5x_xml_node(root))
-
-        if self.safety_info:
-            ctrl.appendChild(self.safety_info.to_l5x_xml_node(root))
-
-        ctrl.appendChild(self.datatypes.to_l5x_xml_node(root))
-        ctrl.appendChild(self.modules.to_l5x_xml_node(root))
-        ctrl.appendChild(self.add_on_instructions.to_l5x_xml_node(root))
-        ctrl.appendChild(self.tags.to_l5x_xml_node(root))
-        ctrl.appendChild(self.programs.to_l5x_xml_node(root))
-        ctrl.appendChild(self.tasks.to_l5x_xml_node(root))
-
-        # create anscillary data
-        cst = root.createElement('CST')
-        cst.setAttribute('MasterID', "0")
-        ctrl.appendChild(cst)
-
-        wct = root.createElement('WallClockTime')
-        wct.setAttribute('LocalTimeAdjustment', '0')
-        wct.setAttribute('TimeZone', '0')
-        ctrl.appendChild(wct)
-
-        ts = root.createElement('TimeSynchronize')
-        ts.setAttribute('Priority1', '128')
-        ts.setAttribute('Priority2', '128')
-        ts.setAttribute('PTPEnable', 'true')
-        ctrl.appendChild(ts)
-
-        eps = root.createElement('EthernetPorts')
-        ep = root.createElement('EthernetPort')
-        ep.setAttribute('Port', '1')
-        ep.setAttribute('Label', '1')
-        ep.setAttribute('PortEnable', 'true')
-        eps.appendChild(ep)
-        ctrl.appendChild(eps)
-
-        # append content to root, then return
-        write_xml_to_l5x(root,
-                         save_location)
+        attributes = {'Use': 'Target'} if as_target else {}
+        attributes['Name'] = self.name
+        attributes['ProcessorType'] = self.controller_type.value
+        attributes['MajorRev'] = str(self.major_rev)
+        attributes['MinorRev'] = str(self.minor_rev)
+        attributes['ProjectCreationDate'] = "Fri Oct 06 12:49:55 2023"
+        attributes['LastModifiedDate'] = "Thu Jan 11 16:29:06 2024"
+        attributes['SFCExecutionControl'] = self.sfc_execution_ctrl.value
+        attributes['SFCRestartPosition'] = self.sfc_restart_pos.value
+        attributes['SFCLastScan'] = self.sfc_last_scan.value
+        attributes['CommPath'] = self.comm_path
+        if self.project_sn:  # idk if all controllers have serial numbers or not, so just in case...
+            attributes['ProjectSN'] = self.project_sn
+        attributes['MatchProjectToController'] = bool_to_l5x(self.match_project_to_controller)
+        attributes['CanUseRPIFromProducer'] = bool_to_l5x(self.can_use_rpi_from_producer)
+        attributes['InhibitAutomaticFirmwareUpdate'] = str(self.inhibit_automatic_firmware_update or 0)
+        attributes['PassThroughConfiguration'] = str(self.pass_through_configuration.value)
+        attributes['DownloadProjectDocumentationAndExtendedProperties'] = bool_to_l5x(
+            self.download_extended_properties)
+        attributes['DownloadProjectCustomProperties'] = bool_to_l5x(self.download_custom_properties)
+        attributes['ReportMinorOverflow'] = bool_to_l5x(self.report_minor_overflow)
+        return attributes
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
+                        include_dependencies: bool = False) -> etree._Element:
         """ abstract implementation of to_l5x_xml_node
             to implement, create and write an xml node and return it
             in the derived class"""
-        ctrl_root = root.createElement('Controller')
-
-        if as_target:
-            ctrl_root.setAttribute('Use', 'Target')
-
-        ctrl_root.setAttribute('Name', self.name)
-        ctrl_root.setAttribute('ProcessorType', self.controller_type.value.__str__())
-        ctrl_root.setAttribute('MajorRev', self.major_rev.__str__())
-        ctrl_root.setAttribute('MinorRev', self.minor_rev.__str__())
-        ctrl_root.setAttribute('ProjectCreationDate', "Fri Oct 06 12:49:55 2023")
-        ctrl_root.setAttribute('LastModifiedDate', "Thu Jan 11 16:29:06 2024")
-        ctrl_root.setAttribute('SFCExecutionControl', self.sfc_execution_ctrl.value.__str__())
-        ctrl_root.setAttribute('SFCRestartPosition', self.sfc_restart_pos.value.__str__())
-        ctrl_root.setAttribute('SFCLastScan', self.sfc_last_scan.value.__str__())
-        ctrl_root.setAttribute('CommPath', self.comm_path)
-        ctrl_root.appendChild(root.createTextNode(''))
-        if self.project_sn:  # idk if all controllers have serial numbers or not, so just in case...
-            ctrl_root.setAttribute('ProjectSN', self.project_sn)
-        ctrl_root.setAttribute('MatchProjectToController', 'true' if self.match_project_to_controller else 'false')
-        ctrl_root.setAttribute('CanUseRPIFromProducer', 'true' if self.can_use_rpi_from_producer else 'false')
-        ctrl_root.setAttribute('InhibitAutomaticFirmwareUpdate',
-                               '0' if not self.inhibit_automatic_firmware_update else self.inhibit_automatic_firmware_update)
-        ctrl_root.setAttribute('PassThroughConfiguration', str(self.pass_through_configuration.value))
-        ctrl_root.setAttribute('DownloadProjectDocumentationAndExtendedProperties',
-                               bool_to_l5x(self.download_extended_properties))
-        ctrl_root.setAttribute('DownloadProjectCustomProperties', bool_to_l5x(self.download_custom_properties))
-        ctrl_root.setAttribute('ReportMinorOverflow', bool_to_l5x(self.report_minor_overflow))
-
-        return ctrl_root
+        return etree.Element('Controller',
+                             attrib=self.__l5x_attributes__(as_target))
@@ -6,14 +6,17 @@
     """
 
 # pylogix imports #
-from l5x import get_text_data, bool_to_l5x, get_first_element, l5x_content_wrapper, \
-    generic_controller_wrapper, write_xml_to_l5x
+from l5x import get_text_data, bool_to_l5x, l5x_content_attributes, l5x_stream_writer, write_l5x_stream_group, \
+    L5X_CONTEXT_EXPORT_OPTIONS
 from base import PyLogixDependencies, LogixRadix, LogixFamily, LogixDataTypeClass, PylogixList, PyLogixObject
 
 # python std lib imports #
 from copy import deepcopy
+import sys
 from typing import Self
-from xml.dom import minidom
+
+# 3rd party imports #
+from lxml import etree
 
 
 class DataTypeMember(PyLogixObject):
@@ -21,6 +24,8 @@ class DataTypeMember(PyLogixObject):
 
         This class acts as a container for datatype information for elements (or members) of a datatype.
         """
+    __slots__ = ('datatype', 'datatype_meta_name', 'dimensions', 'radix', 'hidden', 'external_access', 'target',
+                 'bit_number')
 
     def __init__(self,
                  name: str,
@@ -34,7 +39,8 @@ class DataTypeMember(PyLogixObject):
         super().__init__(name,
                          description)
         self.datatype: DataType | None = None
-        self.datatype_meta_name = datatype_meta_name
+        # the same handful of type names repeat across every member of a project, share one string object each
+        self.datatype_meta_name = sys.intern(datatype_meta_name) if datatype_meta_name else datatype_meta_name
 
         """ due to the way l5x files are parsed
             BITs and BOOLs are not interchangeable. So after reading the L5X in, change BITs to BOOLs. If we need to change this again, it'll happen at L5X compilation time
@@ -46,26 +52,27 @@ class DataTypeMember(PyLogixObject):
         self.radix = radix
         self.hidden = hidden
         self.external_access = 'Read/Write'
-        self.target = target
+        self.target = sys.intern(target) if target else target  # bit members share their backing sint's name
         self.bit_number = bit_number
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
         """ resolve datatype member from l5x xml node
         """
-        if not xml_node:
+        if xml_node is None:
             return None
-        return cls(xml_node.getAttribute('Name'),
+        ga = dict(xml_node.attrib).get  # one attribute pull, then plain dict lookups
+        return cls(ga('Name', ''),
                    get_text_data(xml_node, 'Description'),
-                   xml_node.getAttribute('DataType'),
-                   int(xml_node.getAttribute('Dimension')),
-                   LogixRadix.from_string(xml_node.getAttribute('Radix')),
-                   True if (xml_node.getAttribute('Hidden') == 'true') else False,
-                   xml_node.getAttribute('Target'),
-                   xml_node.getAttribute('BitNumber'))
+                   ga('DataType', ''),
+                   int(ga('Dimension', '')),
+                   LogixRadix.from_string(ga('Radix', '')),
+                   ga('Hidden') == 'true',
+                   ga('Target', ''),
+                   ga('BitNumber', ''))
 
     def rebind(self,
                *args,
@@ -76,31 +83,31 @@ class DataTypeMember(PyLogixObject):
             self.datatype = kwargs['datatypes'].by_name(self.datatype_meta_name)
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        member_root = root.createElement('Member')
-        member_root.setAttribute('Name', self.name)
-        member_root.setAttribute('DataType', self.datatype_meta_name if self.datatype_meta_name != 'BOOL' else (
-            'BIT' if self.dimensions == 0 else 'BOOL'))
-        member_root.setAttribute('Dimension', self.dimensions.__str__())
+                        include_dependencies: bool = False) -> etree._Element:
+        attributes = {'Name': self.name,
+                      'DataType': self.datatype_meta_name if self.datatype_meta_name != 'BOOL' else (
+                          'BIT' if self.dimensions == 0 else 'BOOL'),
+                      'Dimension': str(self.dimensions)}
         if self.radix:
-            member_root.setAttribute('Radix', self.radix.value)
-        member_root.setAttribute('Hidden', bool_to_l5x(self.hidden))
+            attributes['Radix'] = self.radix.value
+        attributes['Hidden'] = bool_to_l5x(self.hidden)
         if self.target:
-            member_root.setAttribute('Target', self.target)
+            attributes['Target'] = self.target
         if self.bit_number:
-            member_root.setAttribute('BitNumber', self.bit_number.__str__())
-        member_root.setAttribute('ExternalAccess', self.external_access)
+            attributes['BitNumber'] = str(self.bit_number)
+        attributes['ExternalAccess'] = self.external_access
+        member_root = etree.Element('Member',
+                                    attrib=attributes)
         if self.description:
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            desc_root.appendChild(root.createTextNode(''))
-            member_root.appendChild(desc_root)
+            desc_root = etree.SubElement(member_root, 'Description')
+            desc_root.text = etree.CDATA(self.description)
         return member_root
 
 
 class DataTypeMemberList(PylogixList[DataTypeMember]):
+    l5x_keyword = 'Members'
+
     def __init__(self):
         super().__init__()
 
@@ -108,12 +115,9 @@ class DataTypeMemberList(PylogixList[DataTypeMember]):
     def object_constructor_type(self):
         return DataTypeMember
 
-    @property
-    def l5x_keyword(self):
-        return 'Members'
-
 
 class DataType(PyLogixObject):
+    __slots__ = ('family', 'datatype_class', 'is_atomic', 'is_base_logix_instruction', 'members')
 
     def __init__(self,
                  name: str,
@@ -131,43 +135,56 @@ class DataType(PyLogixObject):
         self.members: DataTypeMemberList = DataTypeMemberList()
 
     def get_dependencies(self,
-                         include_root: bool = False) -> PyLogixDependencies:
+                         include_root: bool = False,
+                         *,
+                         _acc: PyLogixDependencies | None = None) -> PyLogixDependencies:
         """ get a list of all datatypes this datatype depends on
         """
-        dependencies = PyLogixDependencies()
+        dependencies = _acc if _acc is not None else PyLogixDependencies()
         if self.is_atomic or self.is_base_logix_instruction:
             return dependencies
         if include_root:
-            dependencies.safe_add_item(dependencies.datatypes,
-                                       self)
-        for member in [mem for mem in self.members if
-                       mem.datatype and (not mem.datatype.is_atomic) and (not mem.datatype.is_base_logix_instruction)]:
-            if member.datatype not in dependencies.datatypes:
-                dependencies.datatypes.append(member.datatype)
-            dependencies.extend(member.datatype.get_dependencies())
+            dependencies.add_item('datatypes',
+                                  self)
+        # walk the member graph depth first with an explicit stack, visiting each datatype once
+        # shared leaf types (TIMER, CONTROL, common udts) would otherwise be re-walked per reference
+        visited = set()
+        stack = [self]
+        while stack:
+            datatype = stack.pop()
+            if id(datatype) in visited:
+                continue
+            visited.add(id(datatype))
+            for member in reversed(datatype.members):  # reversed to pop in member order
+                member_type = member.datatype
+                if member_type is None or member_type.is_atomic or member_type.is_base_logix_instruction:
+                    continue
+                stack.append(member_type)
+            if datatype is not self:
+                dependencies.add_item('datatypes',
+                                      datatype)
         return dependencies
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
         """ resolve datatype object from l5x xml node
         """
-        if not xml_node:
+        if xml_node is None:
             return None
-        datatype = cls(xml_node.getAttribute('Name'),
+        datatype = cls(xml_node.get('Name', ''),
                        get_text_data(xml_node, 'Description'),
-                       LogixFamily.from_string(xml_node.getAttribute('Family')),
-                       LogixDataTypeClass.from_string(xml_node.getAttribute('Class')))
-
-        # parse through members if they exist
-        members_list_xml = get_first_element(xml_node,
-                                             'Members')
+                       LogixFamily.from_string(xml_node.get('Family', '')),
+                       LogixDataTypeClass.from_string(xml_node.get('Class', '')))
 
-        if members_list_xml:
-            datatype.members.extend([DataTypeMember.from_l5x_xml_node(member_node) for member_node in
-                                     [x for x in members_list_xml.childNodes if isinstance(x, minidom.Element)]])
+        # parse through members if they exist (members are direct children, no need to search the whole subtree)
+        members_list_xml = xml_node.find('Members')
+        if members_list_xml is not None:
+            members = datatype.members
+            for member_node in members_list_xml.iterchildren('Member'):
+                members.append(DataTypeMember.from_l5x_xml_node(member_node))
 
         return datatype
 
@@ -180,83 +197,63 @@ class DataType(PyLogixObject):
         self.members.rebind(*args,
                             **kwargs)
 
-    def rename_strings(self,
-                       _old_name: str,
-                       _new_name: str):
-        super().rename_strings(_old_name,
-                               _new_name)
-        self.members.rename_strings(_old_name,
-                                    _new_name)
+    def apply_renames(self,
+                      mapping: {str: str}):
+        super().apply_renames(mapping)
+        self.members.apply_renames(mapping)
 
     def to_l5x(self,
                controller_name: str,
                save_location: str) -> None:
-        root, rslogix5000Content = l5x_content_wrapper('DataType',
-                                                       self.name,
-                                                       True,
-                                                       'References NoRawData L5KData DecoratedData Context Dependencies ForceProtectedEncoding AllProjDocTrans')
-        root.insertBefore(root.createComment(self.description), rslogix5000Content)
-        ctrl = generic_controller_wrapper(root,
-                                          controller_name,
-                                          'Context')
-        rslogix5000Content.appendChild(ctrl)
-
-        dts = root.createElement('DataTypes')
-        dts.setAttribute('Use', 'Context')
-
-        dependencies = PyLogixDependencies()
-        dependencies.extend(self.get_dependencies(include_root=True))
+        dependencies = self.get_dependencies(include_root=True)
         dependencies.sort()
-        for dt in dependencies.datatypes:
-            dts.appendChild(dt.to_l5x_xml_node(root,
-                                               as_target=True if dt is self else False,
-                                               include_dependencies=True))
-        ctrl.appendChild(dts)
-        write_xml_to_l5x(root,
-                         save_location)
+        with l5x_stream_writer(save_location,
+                               l5x_content_attributes('DataType',
+                                                      self.name,
+                                                      True,
+                                                      L5X_CONTEXT_EXPORT_OPTIONS),
+                               controller_name,
+                               'Context',
+                               self.description) as xf:
+            write_l5x_stream_group(xf,
+                                   'DataTypes',
+                                   (dt.to_l5x_xml_node(as_target=dt is self,
+                                                       include_dependencies=True) for dt in dependencies.datatypes),
+                                   {'Use': 'Context'})
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element | None:
+                        include_dependencies: bool = False) -> etree._Element | None:
         if self.is_atomic or self.is_base_logix_instruction:
             return None
-        dt_root = root.createElement('DataType')
-
-        if as_target:
-            dt_root.setAttribute('Use', 'Target')
-
-        dt_root.setAttribute('Name', self.name)
-        dt_root.setAttribute('Family', self.family.value)
-
+        attributes = {'Use': 'Target'} if as_target else {}
+        attributes['Name'] = self.name
+        attributes['Family'] = self.family.value
         if self.datatype_class is not LogixDataTypeClass.standard:
-            dt_root.setAttribute('Class', self.datatype_class.value)
+            attributes['Class'] = self.datatype_class.value
+        dt_root = etree.Element('DataType',
+                                attrib=attributes)
 
         if self.description:
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            desc_root.appendChild(root.createTextNode(''))
-            dt_root.appendChild(desc_root)
+            desc_root = etree.SubElement(dt_root, 'Description')
+            desc_root.text = etree.CDATA(self.description)
 
         if len(self.members) > 0:
-            members_root = root.createElement("Members")
-            dependant_members = []
+            members_root = etree.SubElement(dt_root, "Members")
+            dependant_types = []
             for member in self.members:
-                members_root.appendChild(member.to_l5x_xml_node(root))
-                if include_dependencies and member.datatype is not None:
-                    if member.datatype.is_base_logix_instruction or member.datatype.is_atomic:
+                members_root.append(member.to_l5x_xml_node())
+                if include_dependencies:
+                    member_type = member.datatype
+                    if member_type is None or member_type.is_base_logix_instruction or member_type.is_atomic:
                         continue
-                    dependant_members.append(member)
-            dt_root.appendChild(members_root)
-
-            if include_dependencies and len(dependant_members) > 0:
-                dependencies_root = root.createElement('Dependencies')
-                for member in dependant_members:
-                    dependency_node = root.createElement('Dependency')
-                    dependency_node.setAttribute('Type', 'DataType')
-                    dependency_node.setAttribute('Name', member.datatype.name)
-                    dependencies_root.appendChild(dependency_node)
-                dt_root.appendChild(dependencies_root)
+                    dependant_types.append(member_type)
+
+            if dependant_types:
+                dependencies_root = etree.SubElement(dt_root, 'Dependencies')
+                for member_type in dependant_types:
+                    etree.SubElement(dependencies_root, 'Dependency', attrib={'Type': 'DataType',
+                                                                              'Name': member_type.name})
 
         return dt_root
 
@@ -266,8 +263,10 @@ class DataTypeList(PylogixList):
                  create_empty: bool = False):
         super().__init__()
         if not create_empty:
-            for dt in ATOMIC_DATA_TYPES:
-                self.append(dt)
+            # the shared atomic types are known good and uniquely named, so seed the list directly
+            # (the index is built on first lookup)
+            list.extend(self, ATOMIC_DATA_TYPES)
+            self._index_stale = True
 
     @property
     def object_constructor_type(self):
@@ -276,15 +275,13 @@ class DataTypeList(PylogixList):
     def push_updates(self,
                      other_list: Self):
         for obj in self:
-            if obj in other_list:
-                other_list.remove(obj)
-                other_list.append(deepcopy(obj))
-                for d in obj.get_dependencies().datatypes:
-                    if d in other_list:
-                        other_list.remove(d)
-                        other_list.append(d)
-                    elif d not in other_list:
-                        other_list.append(d)
+            if obj not in other_list:  # name index lookup
+                continue
+            other_list.append(deepcopy(obj),
+                              True)  # overwrite replaces the same named datatype
+            for d in obj.get_dependencies().datatypes:
+                other_list.append(d,
+                                  True)
 
     def rebind(self,
                parent: PyLogixObject | None = None,
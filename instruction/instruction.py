@@ -9,6 +9,7 @@
 class Instruction(object):
     """ logix instruction
         """
+    __slots__ = ('mnemonic', 'src_a', 'src_b', 'dest')
 
     def __init__(self, mnemonic: str, src_a: str, src_b: str = None, dest: str = None):
         """ initialize this class
@@ -27,10 +28,5 @@ class Instruction(object):
         """ get neutral text output describing this instruction
             :return: a string of neutral text (e.g., XIC(MyTag,MySecondTag,MyDestinationTag)
             """
-        src_text = self.src_a
-        if self.src_b:
-            src_text += f',{self.src_b}'
-        if self.dest:
-            src_text += f',{self.dest}'
-
+        src_text = ','.join([f'{self.src_a}'] + [src for src in (self.src_b, self.dest) if src])
         return f'{self.mnemonic}({src_text})'
\ No newline at end of file
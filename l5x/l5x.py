@@ -3,107 +3,128 @@
 """ l5x
     this file manages pylogix creating and exporting to/from .L5X files (XML, honestly)
     """
-from typing import Any, Callable
-from xml.dom import minidom
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator
+from lxml import etree
 
+L5X_READ_BUFFER_SIZE = 16 * 1024 * 1024  # read buffer used when streaming l5x files through iterparse
+L5X_CONTEXT_EXPORT_OPTIONS = ('References NoRawData L5KData DecoratedData Context Dependencies '
+                              'ForceProtectedEncoding AllProjDocTrans')  # export options of context (dependency) exports
+_BOOL_TO_L5X = {True: 'true', False: 'false'}
+_BOOL_FROM_L5X = {'true': True, 'false': False}
 
-def conditional_xml_write(element: minidom.Element,
+
+def conditional_xml_write(element: etree._Element,
                           attribute_name: str,
                           attribute: Any):
     """ if a passed attribute is NOT none, write the attribute to the element's attribute list
     """
     if attribute:
-        element.setAttribute(attribute_name, attribute.__str__())
-
+        element.set(attribute_name, str(attribute))
 
-def generic_controller_wrapper(doc: minidom.Document,
-                               name: str,
-                               use: str | None = None) -> minidom.Element:
-    ctrl = doc.createElement('Controller')
-    if use:
-        ctrl.setAttribute('Use', use)
-    ctrl.setAttribute('Name', name)
-    return ctrl
 
-
-def get_first_element(element: minidom.Element | minidom.Document,
-                      element_name: str) -> minidom.Element | None:
-    """ helper function to get the first element of a minidom document's children
-    :param element: minidom.Element
+def get_first_element(element: etree._Element,
+                      element_name: str) -> etree._Element | None:
+    """ helper function to get the first descendant element of an lxml element
+    :param element: etree._Element
     :param element_name: name of element to find
-    :param is_controller_child: boolean to indicate element to look for is a child of controller element
-    :returns: minidom.Element"""
-    nodes = element.getElementsByTagName(element_name)
-    return nodes[0] if len(nodes) > 0 else None
+    :returns: etree._Element"""
+    return element.find(f'.//{element_name}')
 
 
-def get_text_data(element: minidom.Element,
+def get_text_data(element: etree._Element,
                   text_to_find: str):
-    """ helper function to get specified text data from an element node\n
-        this helps with parsing l5x files
-        :param element: element from minidom to inspect for text data
+    """ helper function to get specified text data from a direct child of an element node\n
+        this helps with parsing l5x files (Description, Text, Comment... are always direct children).
+        only the children are scanned, so a node without its own text never picks up a nested node's text
+        :param element: element from lxml to inspect for text data
         :param text_to_find: text to find in nodes
         """
-    node_list = element.getElementsByTagName(text_to_find)
-    return node_list[0].firstChild.wholeText.strip() if len(node_list) > 0 else None
+    node = element.find(text_to_find)
+    return (node.text or '').strip() if node is not None else None
 
 
 def bool_from_l5x(l5x_bool_str: str) -> bool:
-    return True if l5x_bool_str == 'true' else False
+    return _BOOL_FROM_L5X.get(l5x_bool_str, False)
 
 
 def bool_to_l5x(my_bool: bool) -> str:
-    return 'true' if my_bool is True else 'false'
-
-
-def l5x_content_wrapper(target_type: str,
-                        target_name: str | None = None,
-                        contains_context: bool = False,
-                        export_options: str = '',
-                        **kwargs) -> (minidom.Document, minidom.Element):
-    # create root information for xml doc
-    root = minidom.Document()
-    root.encoding = 'UTF-8'
-    root.standalone = True
-    root.createAttribute('encoding')
-
-    # create rslogix5000 content section
-    rslogix5000Content = root.createElement('RSLogix5000Content')
-    rslogix5000Content.setAttribute('SchemaRevision', '1.0')
-    rslogix5000Content.setAttribute('SoftwareRevision', '32.04')
-    if target_name:
-        rslogix5000Content.setAttribute('TargetName', target_name)
-    rslogix5000Content.setAttribute('TargetType', target_type)
-
-    if len(kwargs.items()) > 0:
-        for k, v in kwargs.items():
-            rslogix5000Content.setAttribute(k, v)
-
-    rslogix5000Content.setAttribute('ContainsContext', 'true' if contains_context else 'false')
-    rslogix5000Content.setAttribute('ExportDate', 'Sat Jan 13 12:30:38 2024')
-    rslogix5000Content.setAttribute('ExportOptions', export_options)
-    root.appendChild(rslogix5000Content)
-    return root, rslogix5000Content
-
-
-def open_l5x_to_controller_node(l5x_path: str) -> minidom.Element:
-    xml_doc = minidom.parse(l5x_path)
+    return _BOOL_TO_L5X.get(my_bool, 'false')
 
-    logixContent = xml_doc.getElementsByTagName('RSLogix5000Content')
-    if not logixContent:
-        raise ValueError('incorrect file received. Could not located RSLogix5000Content')
 
-    controller_xml = get_first_element(xml_doc, 'Controller')
-    if not controller_xml:
-        raise ValueError(f'could not locate controller node. incorrect file received.')
-
-    return controller_xml
-
-
-def write_xml_to_l5x(doc: minidom.Document,
-                     save_location: str):
+def l5x_content_attributes(target_type: str,
+                           target_name: str | None = None,
+                           contains_context: bool = False,
+                           export_options: str = '',
+                           **kwargs) -> {str: str}:
+    """ build the attribute dictionary of the rslogix5000 content section (root of the xml doc)
+    """
+    attributes = {'SchemaRevision': '1.0',
+                  'SoftwareRevision': '32.04'}
+    if target_name:
+        attributes['TargetName'] = target_name
+    attributes['TargetType'] = target_type
+    attributes.update(kwargs)
+    attributes['ContainsContext'] = 'true' if contains_context else 'false'
+    attributes['ExportDate'] = 'Sat Jan 13 12:30:38 2024'
+    attributes['ExportOptions'] = export_options
+    return attributes
+
+
+@contextmanager
+def l5x_stream_document(save_location: str,
+                        content_attributes: {str: str},
+                        controller_attributes: {str: str},
+                        comment: str | None = None) -> Iterator[etree.xmlfile]:
+    """ open an incremental l5x writer\n
+        writes the xml declaration, optional comment, rslogix5000 content section and controller element
+        (with the supplied attributes), then yields the writer positioned inside the controller element
+        """
     if not save_location.endswith('.L5X'):
         save_location += '.L5X'
-    with open(f'{save_location}', 'w') as f:
-        f.write(doc.toprettyxml(indent='').replace('<?xml version="1.0" ?>',
-                                                   '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'))
+    with etree.xmlfile(save_location, encoding='UTF-8') as xf:
+        xf.write_declaration(standalone=True)
+        if comment:
+            xf.write(etree.Comment(comment), pretty_print=True)
+        with xf.element('RSLogix5000Content', attrib=content_attributes):
+            xf.write('\n')
+            with xf.element('Controller', attrib=controller_attributes):
+                xf.write('\n')
+                yield xf
+            xf.write('\n')
+
+
+@contextmanager
+def l5x_stream_writer(save_location: str,
+                      content_attributes: {str: str},
+                      controller_name: str,
+                      controller_use: str | None = None,
+                      description: str | None = None) -> Iterator[etree.xmlfile]:
+    """ open an incremental l5x writer\n
+        writes the xml declaration, optional description comment, rslogix5000 content section and controller wrapper,
+        then yields the writer positioned inside the controller element.\n
+        elements written through the yielded writer are serialized immediately and can be released by the caller
+        """
+    controller_attributes = {'Use': controller_use, 'Name': controller_name} if controller_use else {
+        'Name': controller_name}
+    with l5x_stream_document(save_location,
+                             content_attributes,
+                             controller_attributes,
+                             description) as xf:
+        yield xf
+
+
+def write_l5x_stream_group(xf: etree.xmlfile,
+                           group_name: str,
+                           nodes: Iterable[etree._Element | None],
+                           attributes: dict | None = None):
+    """ stream a group element (e.g. 'DataTypes') and each of its child nodes through an l5x stream writer\n
+        nodes may be a generator, so each child is built, written and released one at a time
+        """
+    with xf.element(group_name, attrib=attributes or {}):
+        xf.write('\n')
+        for node in nodes:
+            if node is not None:
+                xf.write(node, pretty_print=True)
+    xf.write('\n')
+    xf.flush()
@@ -1 +1 @@
-from module.module import Module, ModuleList
+from module.module import Module, ModuleList, MODULE_TEXT_KEY
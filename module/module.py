@@ -6,12 +6,16 @@
     """
 
 # pylogix imports #
-from l5x import conditional_xml_write, get_text_data, get_first_element, bool_to_l5x, bool_from_l5x
+from l5x import get_text_data, bool_to_l5x, bool_from_l5x
 from base import PyLogixObject, EKeyState, ModulePortType, PylogixList
 
 # python std lib imports #
 from typing import Self
-from xml.dom import minidom
+
+# 3rd party imports #
+from lxml import etree
+
+MODULE_TEXT_KEY = '#text'  # entry name of a node's own text in module communications / extended properties entries
 
 
 class ModulePort(PyLogixObject):
@@ -33,48 +37,44 @@ class ModulePort(PyLogixObject):
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
         """ abstract implementation of from_l5x method\n
             to implement, compile cls from passed l5x_node\n
             in the derived class"""
-        if not xml_node:
+        if xml_node is None:
             return None
-        bus_xml = xml_node.getElementsByTagName('Bus')
-        if bus_xml:
+        bus_xml = xml_node.find('Bus')
+        if bus_xml is not None:
             try:
-                bus_size = int(bus_xml[0].getAttribute('Size'))
+                bus_size = int(bus_xml.get('Size', ''))
             except ValueError:
                 bus_size = None
         else:
             bus_size = None
 
         # create port object
-        return cls(int(xml_node.getAttribute('Id')),
-                   xml_node.getAttribute('Address'),
-                   ModulePortType.from_string(xml_node.getAttribute('Type')),
-                   bool_from_l5x(xml_node.getAttribute('Upstream')),
-                   xml_node.getAttribute('SafetyNetwork'),
+        return cls(int(xml_node.get('Id', '')),
+                   xml_node.get('Address', ''),
+                   ModulePortType.from_string(xml_node.get('Type', '')),
+                   bool_from_l5x(xml_node.get('Upstream', '')),
+                   xml_node.get('SafetyNetwork', ''),
                    bus_size)
 
-    def to_l5x(self, root: minidom.Document) -> minidom.Element:
-        port_root = root.createElement('Port')
-        port_root.setAttribute('Id', str(self.port_id))
-
+    def to_l5x(self) -> etree._Element:
+        attributes = {'Id': str(self.port_id)}
         if self.address:
-            port_root.setAttribute('Address', str(self.address))
-
-        port_root.setAttribute('Type', self.port_type.value.__str__())
-        port_root.setAttribute('Upstream', bool_to_l5x(self.upstream))
-
+            attributes['Address'] = str(self.address)
+        attributes['Type'] = self.port_type.value
+        attributes['Upstream'] = bool_to_l5x(self.upstream)
         if self.safety_network_number:
-            port_root.setAttribute('SafetyNetwork', self.safety_network_number)
+            attributes['SafetyNetwork'] = self.safety_network_number
+        port_root = etree.Element('Port',
+                                  attrib=attributes)
 
         if self.bus_size:
-            bus_size_root = root.createElement('Bus')
-            bus_size_root.setAttribute('Size', str(self.bus_size))
-            port_root.appendChild(bus_size_root)
+            etree.SubElement(port_root, 'Bus', attrib={'Size': str(self.bus_size)})
 
         return port_root
 
@@ -131,169 +131,147 @@ class Module(PyLogixObject):
         self.extended_properties: {} = {}
 
     @classmethod
-    def __build_module_dict_from_l5x__(cls, node: minidom.Element, dictionary_entry: {}):
-
-        key_index = 0  # use a key index to disambiguate keys, L5X (xml, really) files allow duplicate naming for node children
-        # key index is really just a throw-away variable, so we can use it across for-loops
-        for key, value in node.attributes.items():
-            dictionary_entry[(key, key_index)] = value
-            key_index += 1
-
-        for child_node in [n for n in node.childNodes if (isinstance(n, minidom.Element)) and (n.parentNode == node)]:
-            dictionary_entry[(child_node.localName, key_index)] = {}
-            cls.__build_module_dict_from_l5x__(child_node, dictionary_entry[(child_node.localName, key_index)])
-            key_index += 1
-
-        if not node.firstChild:
-            return
-        try:
-            if not node.firstChild.wholeText:
-                return
-            if ((node.firstChild.wholeText == '\n') |
-                    (node.firstChild.wholeText == ' ')):
-                return
-
-            dictionary_entry['wholeText'] = node.firstChild.wholeText
-        except AttributeError:
+    def __build_module_dict_from_l5x__(cls, node: etree._Element, entries: [(str, str | list)]):
+        """ collect a node's attributes, child nodes and text as an ordered list of (name, value) entries\n
+            attribute values are strings, child nodes are nested entry lists and the node's own text (if any)
+            is stored under MODULE_TEXT_KEY. L5X (xml, really) files allow duplicate naming for node children,
+            so order is kept by the list rather than by unique keys
+            """
+        entries.extend(node.attrib.items())
+
+        for child_node in node.iterchildren(etree.Element):
+            child_entries = []
+            entries.append((child_node.tag, child_entries))
+            cls.__build_module_dict_from_l5x__(child_node, child_entries)
+
+        text = node.text
+        if not text or text.isspace():  # layout whitespace between child nodes is not node text
             return
 
+        entries.append((MODULE_TEXT_KEY, text))
+
     @classmethod
-    def __write_module_dict_to_l5x__(cls, node: minidom.Element, root: minidom.Document, dictionary_entry: {},
-                                     key_name: str) -> minidom.Element:
-        this_root = root.createElement(key_name)
-
-        for key, value in dictionary_entry.items():
-            if type(value) is dict:
-                if type(key) is tuple:
-                    key_name = key[0]
-                else:
-                    key_name = key
-                this_root.appendChild(cls.__write_module_dict_to_l5x__(this_root, root, value, key_name))
+    def __write_module_dict_to_l5x__(cls, node: etree._Element, entries: [(str, str | list)],
+                                     key_name: str) -> etree._Element:
+        this_root = etree.SubElement(node, key_name)
+
+        for key_name, value in entries:
+            if type(value) is list:
+                cls.__write_module_dict_to_l5x__(this_root, value, key_name)
+            elif key_name == MODULE_TEXT_KEY:
+                this_root.text = value
             else:
-                if type(key) is tuple:
-                    key_name = key[0]
-                else:
-                    key_name = key
-                """ check if we need to append any 'wholeText' data
-                    (data not assigned to an attribute)
-                    """
-                if key_name == 'wholeText':  # this key is special. It is reserved for wholeText of the node (if applicable)
-                    this_root.appendChild(root.createTextNode(dictionary_entry['wholeText']))
-                else:
-                    this_root.setAttribute(key_name, value)
+                this_root.set(key_name, value)
 
         return this_root
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
-        if not xml_node:
+        if xml_node is None:
             return None
-        module = cls(xml_node.getAttribute('Name'),
+        ga = dict(xml_node.attrib).get  # one attribute pull, then plain dict lookups
+        module = cls(ga('Name', ''),
                      get_text_data(xml_node, 'Description'),
-                     xml_node.getAttribute('CatalogNumber'),
-                     int(xml_node.getAttribute('Vendor')),
-                     int(xml_node.getAttribute('ProductType')),
-                     int(xml_node.getAttribute('ProductCode')),
-                     int(xml_node.getAttribute('Major')),
-                     int(xml_node.getAttribute('Minor')),
+                     ga('CatalogNumber', ''),
+                     int(ga('Vendor', '')),
+                     int(ga('ProductType', '')),
+                     int(ga('ProductCode', '')),
+                     int(ga('Major', '')),
+                     int(ga('Minor', '')),
                      None,
-                     xml_node.getAttribute('ParentModule'),
-                     int(xml_node.getAttribute('ParentModPortId')),
-                     True if xml_node.getAttribute('Inhibited') == 'true' else False,
-                     True if xml_node.getAttribute('MajorFault') == 'true' else False,
+                     ga('ParentModule', ''),
+                     int(ga('ParentModPortId', '')),
+                     bool_from_l5x(ga('Inhibited', '')),
+                     bool_from_l5x(ga('MajorFault', '')),
                      EKeyState.from_string(
-                         xml_node.getElementsByTagName('EKey')[0].getAttribute('State')),
-                     xml_node.getAttribute('SafetyNetwork'),
-                     True if xml_node.getAttribute('SafetyEnabled') == 'true' else False,
-                     xml_node.getAttribute('UserDefinedVendor'),
-                     xml_node.getAttribute('UserDefinedProductType'),
-                     xml_node.getAttribute('UserDefinedProductCode'),
-                     xml_node.getAttribute('UserDefinedMajor'),
-                     xml_node.getAttribute('UserDefinedMinor'))
-
-        ports_list_xml = xml_node.getElementsByTagName('Ports')[0]
-        if ports_list_xml:
-            module.ports.extend([ModulePort.from_l5x_xml_node(port_node) for port_node in
-                                 [x for x in ports_list_xml.childNodes if isinstance(x, minidom.Element)]])
-
-        communications_xml = get_first_element(xml_node, 'Communications')
-        if communications_xml:
-            module.communications['Communications'] = {}
+                         xml_node.find('EKey').get('State', '')),
+                     ga('SafetyNetwork', ''),
+                     bool_from_l5x(ga('SafetyEnabled', '')),
+                     ga('UserDefinedVendor', ''),
+                     ga('UserDefinedProductType', ''),
+                     ga('UserDefinedProductCode', ''),
+                     ga('UserDefinedMajor', ''),
+                     ga('UserDefinedMinor', ''))
+
+        # Ports, Communications and ExtendedProperties are direct children of the module node,
+        # find them there rather than searching (and re-walking) the communications subtree
+        ports_list_xml = xml_node.find('Ports')
+        if ports_list_xml is not None:
+            module.ports.extend(ModulePort.from_l5x_xml_node(port_node) for port_node in
+                                ports_list_xml.iterchildren(etree.Element))
+
+        communications_xml = xml_node.find('Communications')
+        if communications_xml is not None:
+            module.communications['Communications'] = []
             module.__build_module_dict_from_l5x__(communications_xml,
                                                   module.communications['Communications'])
 
-        extended_properties_xml = get_first_element(xml_node, 'ExtendedProperties')
-        if extended_properties_xml:
-            module.extended_properties['ExtendedProperties'] = {}
+        extended_properties_xml = xml_node.find('ExtendedProperties')
+        if extended_properties_xml is not None:
+            module.extended_properties['ExtendedProperties'] = []
             module.__build_module_dict_from_l5x__(extended_properties_xml,
                                                   module.extended_properties['ExtendedProperties'])
 
         return module
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
+                        include_dependencies: bool = False) -> etree._Element:
         """ abstract implementation of to_l5x_xml_node
             to implement, create and write an xml node and return it
             in the derived class"""
-        module_root = root.createElement('Module')
-
-        if self.name:
-            module_root.setAttribute('Name', self.name)
-
-        module_root.setAttribute('CatalogNumber', self.catalog_number)
-        module_root.setAttribute('Vendor', str(self.vendor))
-        module_root.setAttribute('ProductType', str(self.product_type))
-        module_root.setAttribute('ProductCode', str(self.product_code))
-        module_root.setAttribute('Major', str(self.major))
-        module_root.setAttribute('Minor', str(self.minor))
-
-        conditional_xml_write(module_root, 'UserDefinedVendor', self.user_defined_vendor)
-        conditional_xml_write(module_root, 'UserDefinedProductType', self.user_defined_product_type)
-        conditional_xml_write(module_root, 'UserDefinedProductCode', self.user_defined_product_code)
-        conditional_xml_write(module_root, 'UserDefinedMajor', self.user_defined_major)
-        conditional_xml_write(module_root, 'UserDefinedMinor', self.user_defined_minor)
-
-        module_root.setAttribute('ParentModule', self.parent_name)
-        module_root.setAttribute('ParentModPortId', str(self.parent_port_id))
-        module_root.setAttribute('Inhibited', bool_to_l5x(self.inhibited))
-        module_root.setAttribute('MajorFault', bool_to_l5x(self.major_fault))
+        attributes = {'Name': self.name} if self.name else {}
+        attributes['CatalogNumber'] = self.catalog_number
+        attributes['Vendor'] = str(self.vendor)
+        attributes['ProductType'] = str(self.product_type)
+        attributes['ProductCode'] = str(self.product_code)
+        attributes['Major'] = str(self.major)
+        attributes['Minor'] = str(self.minor)
+
+        for key, value in (('UserDefinedVendor', self.user_defined_vendor),
+                           ('UserDefinedProductType', self.user_defined_product_type),
+                           ('UserDefinedProductCode', self.user_defined_product_code),
+                           ('UserDefinedMajor', self.user_defined_major),
+                           ('UserDefinedMinor', self.user_defined_minor)):
+            if value:  # same rule as conditional_xml_write
+                attributes[key] = str(value)
+
+        attributes['ParentModule'] = self.parent_name
+        attributes['ParentModPortId'] = str(self.parent_port_id)
+        attributes['Inhibited'] = bool_to_l5x(self.inhibited)
+        attributes['MajorFault'] = bool_to_l5x(self.major_fault)
 
         if self.safety_enabled:
-            module_root.setAttribute('SafetyEnabled', bool_to_l5x(self.safety_enabled))
+            attributes['SafetyEnabled'] = bool_to_l5x(self.safety_enabled)
 
         if self.safety_network_number:
-            module_root.setAttribute('SafetyNetwork', self.safety_network_number)
+            attributes['SafetyNetwork'] = self.safety_network_number
+
+        module_root = etree.Element('Module',
+                                    attrib=attributes)
 
         if self.description:
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            module_root.appendChild(desc_root)
+            desc_root = etree.SubElement(module_root, 'Description')
+            desc_root.text = etree.CDATA(self.description)
 
-        ekey_root = root.createElement('EKey')
-        ekey_root.setAttribute('State', self.ekey_state.value)
-        module_root.appendChild(ekey_root)
+        etree.SubElement(module_root, 'EKey', attrib={'State': self.ekey_state.value})
 
-        ports_root = root.createElement('Ports')
+        ports_root = etree.SubElement(module_root, 'Ports')
         for port in self.ports:
-            ports_root.appendChild(port.to_l5x(root))
-        module_root.appendChild(ports_root)
+            ports_root.append(port.to_l5x())
 
         if self.communications:
-            module_root.appendChild(self.__write_module_dict_to_l5x__(module_root,
-                                                                      root,
-                                                                      self.communications['Communications'],
-                                                                      'Communications'))
+            self.__write_module_dict_to_l5x__(module_root,
+                                              self.communications['Communications'],
+                                              'Communications')
 
         if self.extended_properties:
-            module_root.appendChild(self.__write_module_dict_to_l5x__(module_root,
-                                                                      root,
-                                                                      self.extended_properties['ExtendedProperties'],
-                                                                      'ExtendedProperties'))
+            self.__write_module_dict_to_l5x__(module_root,
+                                              self.extended_properties['ExtendedProperties'],
+                                              'ExtendedProperties')
 
         return module_root
 
@@ -12,10 +12,11 @@ from routine import Routine, RoutineList
 from tag import Tag, TagList
 
 # python std lib imports #
-from copy import deepcopy
 from difflib import SequenceMatcher
 from typing import Self
-from xml.dom import minidom
+
+# 3rd party imports #
+from lxml import etree
 
 
 class Program(PyLogixObject):
@@ -40,15 +41,24 @@ class Program(PyLogixObject):
 
     @property
     def driver_routines(self):
-        return [routine for routine in self.routines if routine.description_properties.type == 'DRIVER']
+        return self.__routines_by_type__().get('DRIVER', [])
 
     @property
     def internal_routines(self):
-        return [routine for routine in self.routines if routine.description_properties.type == 'INTERNAL']
+        return self.__routines_by_type__().get('INTERNAL', [])
 
     @property
     def main_routine(self):
-        return next((routine for routine in self.routines if routine.description_properties.type == 'MAIN'), None)
+        return next(iter(self.__routines_by_type__().get('MAIN', ())), None)
+
+    def __routines_by_type__(self) -> {str: [Routine]}:
+        """ group this program's routines by description type in a single pass (routine order is kept)\n
+            built on request rather than maintained, since description types only change when a routine is rebound
+            """
+        routines_by_type = {}
+        for routine in self.routines:
+            routines_by_type.setdefault(routine.description_properties.type, []).append(routine)
+        return routines_by_type
 
     @classmethod
     def __push_driver_routine__(cls,
@@ -78,15 +88,17 @@ class Program(PyLogixObject):
         """
         for entry in routine_updates:
             other_prog.routines.remove(entry['routine'])
-            new_routine: Routine = deepcopy(routine)
-            new_routine.name = new_routine.name.replace(entry['name_split'][0], entry['other_name_split'][0])
-            new_routine.name = new_routine.name.replace(entry['name_split'][1], entry['other_name_split'][1])
+            new_routine: Routine = routine.clone()  # only names and rung text are edited, no need for a deepcopy
+            # swap the first name part, then the second (the name setter validates the final name once)
+            name_split, other_split = entry['name_split'], entry['other_name_split']
+            new_routine.name = new_routine.name.replace(name_split[0], other_split[0]).replace(name_split[1],
+                                                                                               other_split[1])
             for rung in new_routine.rungs:
                 rung.text = rung.text.replace(entry['name_split'][1], entry['other_name_split'][1])
                 for tag in rung.tags:
                     tag.name = tag.name.replace(entry['name_split'][1], entry['other_name_split'][1])
             other_prog.routines.append(new_routine)
-            dependencies.extend(new_routine.get_dependencies())
+            new_routine.get_dependencies(_acc=dependencies)
         return dependencies
 
     @classmethod
@@ -94,87 +106,117 @@ class Program(PyLogixObject):
                          routine: Routine,
                          other_program: Self,
                          use_similarity_finding: bool = False,
-                         similarity_gain: float = 0.95) -> PyLogixDependencies:
+                         similarity_gain: float = 0.95,
+                         dependencies: PyLogixDependencies | None = None) -> PyLogixDependencies:
+        """ push a routine into another program, replacing its counterpart there\n
+            pass the routine's dependencies if they were already gathered to skip walking its rungs again
+            """
         if not routine:
             return PyLogixDependencies()
-        dependencies = routine.get_dependencies()
+        if dependencies is None:
+            dependencies = routine.get_dependencies()
 
         if use_similarity_finding:
-            target_routine = next((r for r in other_program.routines if
-                                   SequenceMatcher(None, routine.name, r.name).ratio() >= similarity_gain), None)
+            # real_quick_ratio / quick_ratio are cheap upper bounds of ratio (same idiom as difflib.get_close_matches),
+            # so the full matching-block ratio is only computed for names that could still reach the gain
+            matcher = SequenceMatcher(None, routine.name)
+            target_routine = None
+            for r in other_program.routines:
+                matcher.set_seq2(r.name)
+                if (matcher.real_quick_ratio() >= similarity_gain and
+                        matcher.quick_ratio() >= similarity_gain and
+                        matcher.ratio() >= similarity_gain):
+                    target_routine = r
+                    break
         else:
             target_routine = other_program.routines.by_name(routine.name)
 
-        if target_routine in other_program.routines:
+        if target_routine is not None:  # both lookups above only return routines of the other program
             other_program.routines.remove(target_routine)
         other_program.routines.append(routine)
         other_program.tags.extend(dependencies.program_tags)
         return dependencies
 
     def get_dependencies(self,
-                         include_root: bool = False) -> PyLogixDependencies:
-        dependencies = PyLogixDependencies()
+                         include_root: bool = False,
+                         *,
+                         _acc: PyLogixDependencies | None = None) -> PyLogixDependencies:
+        dependencies = _acc if _acc is not None else PyLogixDependencies()
         if include_root:
-            dependencies.safe_add_item(dependencies.programs,
-                                       self)
+            dependencies.add_item('programs',
+                                  self)
         for routine in self.routines:
-            dependencies.extend(routine.get_dependencies())
+            routine.get_dependencies(_acc=dependencies)
         for tag in self.tags:
-            dependencies.extend(tag.get_dependencies(include_root=False))
+            tag.get_dependencies(include_root=False,
+                                 _acc=dependencies)
         return dependencies
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
         """ generate a tag CLA object from l5x
         """
-        if not xml_node:
+        if xml_node is None:
             return None
-        program = cls(xml_node.getAttribute('Name'),
+        program = cls(xml_node.get('Name', ''),
                       get_text_data(xml_node, 'Description'),
                       False,
-                      xml_node.getAttribute('MainRoutineName'),
-                      bool_from_l5x(xml_node.getAttribute('Disabled')),
-                      LogixClass.from_string(xml_node.getAttribute('Class')),
-                      bool_from_l5x(xml_node.getAttribute('UseAsFolder')))
+                      xml_node.get('MainRoutineName', ''),
+                      bool_from_l5x(xml_node.get('Disabled', '')),
+                      LogixClass.from_string(xml_node.get('Class', '')),
+                      bool_from_l5x(xml_node.get('UseAsFolder', '')))
 
         # parse through tags if they exist
-        tags_list_xml = xml_node.getElementsByTagName('Tags')[0]
-        if tags_list_xml:
-            tag_nodes = [x for x in tags_list_xml.childNodes if isinstance(x, minidom.Element)]
-            program.tags.extend([Tag.from_l5x_xml_node(tag_node,
-                                                       **kwargs) for tag_node in tag_nodes])
+        # Tags and Routines are direct children, a descendant search for Routines would first walk every tag's data
+        tags_list_xml = xml_node.find('Tags')
+        if tags_list_xml is not None:
+            tag_nodes = tags_list_xml.iterchildren(etree.Element)
+            program.tags.extend(Tag.from_l5x_xml_node(tag_node,
+                                                      **kwargs) for tag_node in tag_nodes)
         kwargs['program_tags'] = program.tags  # assign program tags so routines and rungs can properly get tag datas
 
         # parse through routines if they exist
-        routines_list_xml = xml_node.getElementsByTagName('Routines')[0]
-        if routines_list_xml:
-            routine_nodes = [x for x in routines_list_xml.childNodes if isinstance(x, minidom.Element)]
-            program.routines.extend([Routine.from_l5x_xml_node(routine_node,
-                                                               **kwargs) for routine_node in
-                                     routine_nodes])
+        routines_list_xml = xml_node.find('Routines')
+        if routines_list_xml is not None:
+            routine_nodes = routines_list_xml.iterchildren(etree.Element)
+            program.routines.extend(Routine.from_l5x_xml_node(routine_node,
+                                                              **kwargs) for routine_node in routine_nodes)
         return program
 
     def push_updates(self,
                      other_prog: Self,
                      use_similarity_finding: bool = False,
                      similarity_gain: float = 0.95) -> PyLogixDependencies:
-        dependencies = self.get_dependencies()
-
-        dependencies.extend(self.__push_routine__(self.main_routine,
-                                                  other_prog))
-        for driver in self.driver_routines:
+        # gather each routine's dependencies once, they make up this program's dependencies
+        # and are handed back to __push_routine__ rather than walking the same rungs a second time
+        dependencies = PyLogixDependencies()
+        routine_dependencies = {}
+        for routine in self.routines:
+            routine_dependencies[id(routine)] = routine.get_dependencies()
+            dependencies.extend(routine_dependencies[id(routine)])
+        for tag in self.tags:
+            tag.get_dependencies(include_root=False,
+                                 _acc=dependencies)
+        routines_by_type = self.__routines_by_type__()  # one pass instead of one per routine property
+
+        main_routine = next(iter(routines_by_type.get('MAIN', ())), None)
+        dependencies.extend(self.__push_routine__(main_routine,
+                                                  other_prog,
+                                                  dependencies=routine_dependencies.get(id(main_routine))))
+        for driver in routines_by_type.get('DRIVER', ()):
             dependencies.extend(self.__push_driver_routine__(driver,
                                                              other_prog))
 
         if not self.description_properties.type == 'DEVICE':
-            for internal in self.internal_routines:
+            for internal in routines_by_type.get('INTERNAL', ()):
                 dependencies.extend(self.__push_routine__(internal,
                                                           other_prog,
                                                           use_similarity_finding,
-                                                          similarity_gain))
+                                                          similarity_gain,
+                                                          routine_dependencies[id(internal)]))
         return dependencies
 
     def rebind(self,
@@ -183,69 +225,65 @@ class Program(PyLogixObject):
         """ rebind datatype
         """
         super().rebind()
+        generator_properties = None  # the last driver routine decides, as before
         for routine in self.routines:
             routine.rebind(*args,
                            **kwargs)
+            if routine.description_properties.type != 'DRIVER':
+                continue
+            generator_properties = []
+            for rung in routine.rungs:
+                rung_properties = rung.property_list_from_string(rung.comment)
+                if '@GENERATOR' in rung_properties:
+                    generator_properties = rung_properties
+                    break
         for tag in self.tags:
             tag.rebind(*args,
                        **kwargs)
 
-        for driver in self.driver_routines:
-            self._generator_properties = next((rung.property_list_from_string(rung.comment) for rung in driver.rungs if
-                                               '@GENERATOR' in rung.property_list_from_string(rung.comment)), [])
-        for x in range(len(self._generator_properties)):
-            self._generator_properties[x] = self._generator_properties[x].strip()
+        if generator_properties is None:
+            generator_properties = self._generator_properties
+        self._generator_properties = [prop.strip() for prop in generator_properties]
 
-    def rename_strings(self,
-                       _old_name: str,
-                       _new_name: str):
-        super().rename_strings(_old_name, _new_name)
-        self.tags.rename_strings(_old_name, _new_name)
-        self.routines.rename_strings(_old_name, _new_name)
+    def apply_renames(self,
+                      mapping: {str: str}):
+        super().apply_renames(mapping)
+        self.tags.apply_renames(mapping)
+        self.routines.apply_renames(mapping)
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        program_root = root.createElement('Program')
-        program_root.setAttribute('Name', self.name)
-        program_root.setAttribute('TestEdits', bool_to_l5x(self.test_edits))
-        program_root.setAttribute('MainRoutineName', self.main_routine_name)
-        program_root.setAttribute('Disabled', bool_to_l5x(self.disabled))
-        program_root.setAttribute('Class', self.program_class.value.__str__())
-        program_root.setAttribute('UseAsFolder', bool_to_l5x(self.use_as_folder))
+                        include_dependencies: bool = False) -> etree._Element:
+        program_root = etree.Element('Program',
+                                     attrib={'Name': self.name,
+                                             'TestEdits': bool_to_l5x(self.test_edits),
+                                             'MainRoutineName': self.main_routine_name,
+                                             'Disabled': bool_to_l5x(self.disabled),
+                                             'Class': self.program_class.value,
+                                             'UseAsFolder': bool_to_l5x(self.use_as_folder)})
 
         if self.description:
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            program_root.appendChild(desc_root)
+            desc_root = etree.SubElement(program_root, 'Description')
+            desc_root.text = etree.CDATA(self.description)
 
-        tags_root = root.createElement('Tags')
+        tags_root = etree.SubElement(program_root, 'Tags')
         for tag in self.tags:
-            tags_root.appendChild(tag.to_l5x_xml_node(root))
+            tags_root.append(tag.to_l5x_xml_node())
 
-        routines_root = root.createElement('Routines')
+        routines_root = etree.SubElement(program_root, 'Routines')
         for routine in self.routines:
-            routines_root.appendChild(routine.to_l5x_xml_node(root))
-
-        program_root.appendChild(tags_root)
-        program_root.appendChild(routines_root)
+            routines_root.append(routine.to_l5x_xml_node())
 
         return program_root
 
 
 class ProgramList(PylogixList):
+    l5x_child_keyword = 'Program'
+    l5x_keyword = 'Programs'
+
     def __init__(self):
         super().__init__()
 
-    @property
-    def l5x_child_keyword(self):
-        return 'Program'
-
-    @property
-    def l5x_keyword(self):
-        return 'Programs'
-
     @property
     def object_constructor_type(self):
         return Program
@@ -253,20 +291,26 @@ class ProgramList(PylogixList):
     def push_updates(self,
                      other_list: Self) -> PyLogixDependencies:
         dependencies = PyLogixDependencies()
+
+        # read each program's type once and group the other list by it (in list order)
+        # a DEVICE program matches every typed program, any other type only matches programs of the same type
+        typed_others = [(other_prog.description_properties.type, other_prog) for other_prog in other_list if
+                        other_prog.description_properties.type]
+        others_by_type = {}
+        for other_type, other_prog in typed_others:
+            others_by_type.setdefault(other_type, []).append((other_type, other_prog))
+
         for prog in self:
-            if not prog.description_properties.type:
+            prog_type = prog.description_properties.type
+            if not prog_type:
                 continue
-            for other_prog in other_list:
-                if not other_prog.description_properties.type:
-                    continue
-
-                if prog.description_properties.type == other_prog.description_properties.type or (
-                        prog.description_properties.type == 'DEVICE'):
-                    if prog.description_properties.type == other_prog.description_properties.type:
-                        other_prog.description = prog.description
-                    dependencies.extend(prog.push_updates(other_prog,
-                                                          use_similarity_finding=True,
-                                                          similarity_gain=0.95))
+            candidates = typed_others if prog_type == 'DEVICE' else others_by_type.get(prog_type, ())
+            for other_type, other_prog in candidates:
+                if other_type == prog_type:
+                    other_prog.description = prog.description
+                dependencies.extend(prog.push_updates(other_prog,
+                                                      use_similarity_finding=True,
+                                                      similarity_gain=0.95))
         return dependencies
 
     def rebind(self,
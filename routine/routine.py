@@ -11,7 +11,10 @@ from base import LogixRoutineType, PyLogixObject, PyLogixDependencies, PylogixLi
 from rung import Rung, RungList
 
 # python std lib imports #
-from xml.dom import minidom
+from typing import Self
+
+# 3rd party imports #
+from lxml import etree
 
 
 class Routine(PyLogixObject):
@@ -25,36 +28,43 @@ class Routine(PyLogixObject):
         self.routine_type = routine_type
         self.rungs: [Rung] = []
 
+    def clone(self) -> Self:
+        """ copy this routine for editing\n
+            every rung is cloned, so the copy's rungs (and their tags) can be renamed without touching this routine
+            """
+        _clone = super().clone()
+        _clone.rungs = [rung.clone() for rung in self.rungs]
+        return _clone
+
     def get_dependencies(self,
-                         include_root: bool = False) -> PyLogixDependencies:
-        dependencies = PyLogixDependencies()
+                         include_root: bool = False,
+                         *,
+                         _acc: PyLogixDependencies | None = None) -> PyLogixDependencies:
+        dependencies = _acc if _acc is not None else PyLogixDependencies()
         for rung in self.rungs:
-            dependencies.extend(rung.get_dependencies())
+            rung.get_dependencies(_acc=dependencies)
 
         return dependencies
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
         """ generate a tag CLA object from l5x
         """
-        if not xml_node:
+        if xml_node is None:
             return None
-        routine = cls(xml_node.getAttribute('Name'),
+        routine = cls(xml_node.get('Name', ''),
                       get_text_data(xml_node, 'Description'),
-                      LogixRoutineType.from_string(xml_node.getAttribute('Type')))
+                      LogixRoutineType.from_string(xml_node.get('Type', '')))
 
         # parse through routines if they exist
-        try:
-            rungs_list_xml = xml_node.getElementsByTagName('RLLContent')[0]
-            if rungs_list_xml:
-                rung_nodes = [x for x in rungs_list_xml.childNodes if isinstance(x, minidom.Element)]
-                routine.rungs.extend([Rung.from_l5x_xml_node(rung_node,
-                                                             **kwargs) for rung_node in rung_nodes])
-        except IndexError:
-            pass
+        rungs_list_xml = xml_node.find('RLLContent')  # direct child of the routine node
+        if rungs_list_xml is not None:
+            rung_nodes = rungs_list_xml.iterchildren(etree.Element)
+            routine.rungs.extend(Rung.from_l5x_xml_node(rung_node,
+                                                        **kwargs) for rung_node in rung_nodes)
 
         return routine
 
@@ -69,30 +79,26 @@ class Routine(PyLogixObject):
             rung.rebind(*args,
                         **kwargs)
 
-    def rename_strings(self,
-                       _old_name: str,
-                       _new_name: str):
-        super().rename_strings(_old_name, _new_name)
-        for _rung in self.rungs:
-            _rung.rename_strings(_old_name, _new_name)
+    def apply_renames(self,
+                      mapping: {str: str}):
+        super().apply_renames(mapping)
+        for rung in self.rungs:
+            rung.apply_renames(mapping)
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        routine_root = root.createElement('Routine')
-        routine_root.setAttribute('Name', self.name)
-        routine_root.setAttribute('Type', self.routine_type.value.__str__())
+                        include_dependencies: bool = False) -> etree._Element:
+        routine_root = etree.Element('Routine')
+        routine_root.set('Name', self.name)
+        routine_root.set('Type', self.routine_type.value)
 
         if self.description:
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            routine_root.appendChild(desc_root)
+            desc_root = etree.SubElement(routine_root, 'Description')
+            desc_root.text = etree.CDATA(self.description)
 
-        rll_content_root = root.createElement('RLLContent')
+        rll_content_root = etree.SubElement(routine_root, 'RLLContent')
         for rung in self.rungs:
-            rll_content_root.appendChild(rung.to_l5x(root))
-        routine_root.appendChild(rll_content_root)
+            rll_content_root.append(rung.to_l5x())
 
         return routine_root
 
@@ -11,15 +11,22 @@ from l5x import get_text_data
 from tag import TagList
 
 # python std lib imports #
-from copy import copy
 from itertools import chain
 import re
-from xml.dom import minidom
+from typing import Self
+
+# 3rd party imports #
+from lxml import etree
+
+_INSTRUCTION_ILLEGAL_CHARS = re.compile('[' + re.escape(''.join([',', '"', "'", '?', ':', '[', ']'])) + ']')
+_TAG_ILLEGAL_CHARS = re.compile('[' + re.escape(''.join([',', '"', "'", '?', ':'])) + ']')
+_INTEGER_LITERAL = re.compile(r'\s*[+-]?\d+(?:_\d+)*\s*')  # what int() would accept, matched with fullmatch
 
 
 class Rung(PyLogixObject):
     """ logix rung
         """
+    __slots__ = ('number', 'rung_type', 'text', 'tags', 'program_tags', 'add_on_instructions', 'comment')
 
     def __init__(self,
                  description: str | None = None,
@@ -40,82 +47,85 @@ class Rung(PyLogixObject):
         self.add_on_instructions: [] = []
         self.comment: str | None = comment
 
-    def __get_tag_metas__(self) -> [str]:
-        if not self.text:
-            return []
+    def __get_text_metas__(self) -> ([str], [str]):
+        """ get the tag and instruction names referenced by this rung's text, in a single pass over the text
+            :return: (tag meta names, instruction meta names)
+            """
+        if not self.text or '(' not in self.text:  # no operand list, so no instructions or tags to find
+            return [], []
 
-        iter_instructions = list(chain.
-        from_iterable(
-            [instr[instr.find('(') + 1:].split(',') for instr in self.text.split(')') if '(' in instr]))
-        upper_tags_pre = list(set([tag.split('.')[0] for tag in iter_instructions]))
+        instructions = set()
+        upper_tags_pre = set()
+        for instruction in self.text.split(')'):
+            paren = instruction.find('(')
+            if paren == -1:  # trailing text after the last operand list (e.g. ';'), no instruction here
+                continue
+            instructions.add(_INSTRUCTION_ILLEGAL_CHARS.sub('', instruction[:paren]).strip())
+            for operand in instruction[paren + 1:].split(','):
+                upper_tags_pre.add(operand.partition('.')[0])
 
-        illegal_chars = [',', '"', "'", '?', ':']
         upper_tags = []
         for tag in upper_tags_pre:  # remove any values that are straight up just a number... these are not dependant on anything
             if not tag:
                 continue
-            if any(x in tag for x in illegal_chars):
-                continue
-            try:
-                _ = int(tag)
+            if _TAG_ILLEGAL_CHARS.search(tag) or _INTEGER_LITERAL.fullmatch(tag):
                 continue
-            except ValueError:
-                pass
             bracket_char = tag.find('[')
             if bracket_char != -1:
                 tag = tag[:bracket_char]
             upper_tags.append(tag)
 
-        return upper_tags
+        return upper_tags, list(instructions)
+
+    def __get_tag_metas__(self) -> [str]:
+        return self.__get_text_metas__()[0]
 
     def __get_instruction_metas__(self) -> [str]:
-        output_instructions = []
-        if not self.text:
-            return output_instructions
-        illegal_chars = [',', '"', "'", '?', ':', '[', ']']
-        rx = '[' + re.escape(''.join(illegal_chars)) + ']'
-        for instruction in self.text.split(')'):
-            inst = instruction[:instruction.find('(')]
-            output_instructions.append(re.sub(rx, '', inst).strip())
-        return list(set(output_instructions))
+        return self.__get_text_metas__()[1]
 
     def get_dependencies(self,
-                         include_root: bool = False) -> PyLogixDependencies:
-        dependencies = PyLogixDependencies()
-        [dependencies.safe_add_item(dependencies.tags,
-                                    tag) for tag in self.tags]
-        [dependencies.safe_add_item(dependencies.program_tags,
-                                    program_tag) for program_tag in self.program_tags]
-        [dependencies.safe_add_item(dependencies.add_on_instructions,
-                                    aoi) for aoi in self.add_on_instructions]
-        ([dependencies.extend(tag.datatype.get_dependencies(include_root=True)) for tag in self.tags
-          if tag.datatype and
-          not tag.datatype.is_atomic and
-          not tag.datatype.is_base_logix_instruction])
-        ([dependencies.extend(program_tag.datatype.get_dependencies(include_root=True)) for program_tag in
-          self.program_tags
-          if program_tag.datatype and
-          not program_tag.datatype.is_atomic and
-          not program_tag.datatype.is_base_logix_instruction])
+                         include_root: bool = False,
+                         *,
+                         _acc: PyLogixDependencies | None = None) -> PyLogixDependencies:
+        dependencies = _acc if _acc is not None else PyLogixDependencies()
+        add_item = dependencies.add_item
+        for tag in self.tags:
+            add_item('tags',
+                     tag)
+        for program_tag in self.program_tags:
+            add_item('program_tags',
+                     program_tag)
+        for aoi in self.add_on_instructions:
+            add_item('add_on_instructions',
+                     aoi)
+        walked = set()  # ids of datatypes already walked, many tags of a rung tend to share a udt
+        for tag in chain(self.tags, self.program_tags):
+            datatype = tag.datatype
+            if not datatype or id(datatype) in walked or datatype.is_atomic or datatype.is_base_logix_instruction:
+                continue
+            walked.add(id(datatype))
+            datatype.get_dependencies(include_root=True,
+                                      _acc=dependencies)
         return dependencies
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
         """ generate a tag CLA object from l5x
         """
-        if not xml_node:
+        if xml_node is None:
             return None
         rung = cls(get_text_data(xml_node, 'Description'),
-                   int(xml_node.getAttribute('Number')),
-                   LogixRungType.from_string(xml_node.getAttribute('Type')),
+                   int(xml_node.get('Number', '')),
+                   LogixRungType.from_string(xml_node.get('Type', '')),
                    get_text_data(xml_node, 'Text'),
                    get_text_data(xml_node, 'Comment'))
 
+        tag_metas, instruction_metas = rung.__get_text_metas__()
         try:
-            for tag_meta_name in rung.__get_tag_metas__():
+            for tag_meta_name in tag_metas:
                 tag = kwargs['tags'].by_name(tag_meta_name)
                 if tag:
                     rung.tags.append(tag)
@@ -124,7 +134,7 @@ class Rung(PyLogixObject):
                 if tag:
                     rung.program_tags.append(tag)
                     continue
-            for instruction in rung.__get_instruction_metas__():
+            for instruction in instruction_metas:
                 instr = kwargs['add_on_instructions'].by_name(instruction)
                 if instr:
                     rung.add_on_instructions.append(instr)
@@ -134,38 +144,40 @@ class Rung(PyLogixObject):
 
         return rung
 
-    def to_l5x(self, root: minidom.Document) -> minidom.Element:
-        rung_root = root.createElement('Rung')
-        rung_root.setAttribute('Number', str(self.number))
-        rung_root.setAttribute('Type', self.rung_type.value.__str__())
+    def to_l5x(self) -> etree._Element:
+        rung_root = etree.Element('Rung',
+                                  attrib={'Number': str(self.number),
+                                          'Type': self.rung_type.value})
 
         if self.comment:
-            comment_root = root.createElement('Comment')
-            comment_root.appendChild(root.createCDATASection(self.comment))
-            rung_root.appendChild(comment_root)
+            comment_root = etree.SubElement(rung_root, 'Comment')
+            comment_root.text = etree.CDATA(self.comment)
 
         if self.text:
-            text_root = root.createElement('Text')
-            text_root.appendChild(root.createCDATASection(self.text))
-            rung_root.appendChild(text_root)
+            text_root = etree.SubElement(rung_root, 'Text')
+            text_root.text = etree.CDATA(self.text)
 
         return rung_root
 
+    def clone(self) -> Self:
+        """ copy this rung for editing\n
+            the copy owns its tag lists and clones of its tags, so its text, tag names and tag data can be edited
+            without touching this rung (the tags' datatypes stay shared)
+            """
+        _clone = super().clone()
+        _clone.tags = TagList()
+        _clone.tags.extend(tag.clone() for tag in self.tags)
+        _clone.program_tags = TagList()
+        _clone.program_tags.extend(tag.clone() for tag in self.program_tags)
+        _clone.add_on_instructions = list(self.add_on_instructions)
+        return _clone
+
     def rebind(self,
                *args,
                **kwargs) -> None:
         super().rebind(*args,
                        **kwargs)
         try:
-            for tag in [t for t in self.tags if t.alias_for and t.alias_for != '']:
-                ctrl_tag = kwargs['tags'].by_name(tag.alias_for)
-                if not ctrl_tag:
-                    continue
-
-                tag_alias_for = tag.alias_for
-                tag = copy(ctrl_tag)
-                tag.alias_for = tag_alias_for
-
             for tag in [t for t in self.program_tags if t.alias_for and t.alias_for != '']:
                 ctrl_tag = kwargs['tags'].by_name(tag.alias_for)
                 if not ctrl_tag:
@@ -175,15 +187,12 @@ class Rung(PyLogixObject):
         except KeyError:
             return
 
-    def rename_strings(self,
-                       _old_name: str,
-                       _new_name: str):
-        if self.text:
-            self.text = self.text.replace(_old_name, _new_name)
-        if self.comment:
-            self.comment = self.comment.replace(_old_name, _new_name)
-        self.tags.rename_strings(_old_name, _new_name)
-        self.program_tags.rename_strings(_old_name, _new_name)
+    def apply_renames(self,
+                      mapping: {str: str}):
+        self.text = self.__apply_renames__(self.text, mapping)
+        self.comment = self.__apply_renames__(self.comment, mapping)
+        self.tags.apply_renames(mapping)
+        self.program_tags.apply_renames(mapping)
 
     def to_dict(self) -> {}:
         """ compile this rung to a dictionary
@@ -7,17 +7,22 @@
 
 # pylogix imports #
 from datatype import DataType, DataTypeMember
-from l5x import get_text_data, get_first_element, bool_to_l5x, bool_from_l5x
+from l5x import get_text_data, bool_to_l5x, bool_from_l5x
 from base import PyLogixDependencies, LogixClass, LogixTagType, TagUsage, PyLogixObject, PylogixList, LogixRadix
 
 # python std lib imports #
+from copy import copy, deepcopy
 from typing import Self
-from xml.dom import minidom
+
+# 3rd party imports #
+from lxml import etree
 
 
 class Tag(PyLogixObject):
     """ logix tag
         """
+    __slots__ = ('logix_class', 'tag_type', 'datatype', 'datatype_meta_name', 'radix', 'constant', 'external_access',
+                 'dimensions', 'alias_for', 'usage', 'data')
 
     def __init__(self,
                  name: str,
@@ -55,22 +60,27 @@ class Tag(PyLogixObject):
         if not dim_string:  # if the string is null or empty, return with no dimensions
             return None
 
-        try:  # assess if we are a single dimension
-            return int(dim_string)
-        except ValueError:
-            pass
+        if isinstance(dim_string, int):
+            return dim_string
 
-        # try to parse up to 3 dimensions
-        multi_dim = dim_string.split(' ')
+        # parse up to 3 space separated dimensions, a single dimension is returned as a plain int
         try:
-            if len(multi_dim) == 2:
-                return [int(multi_dim[0]), int(multi_dim[1])]
-            if len(multi_dim) == 3:
-                return [int(multi_dim[0]), int(multi_dim[1]), int(multi_dim[2])]
+            dimensions = [int(x) for x in dim_string.split()]
         except ValueError:
             return None
+        match len(dimensions):
+            case 1:
+                return dimensions[0]
+            case 2 | 3:
+                return dimensions
         return None
 
+    @staticmethod
+    def __dimensions_to_l5x__(dimensions: int | list) -> str:
+        """ format dimensions the way __get_dimensions_from_str__ reads them (space separated)
+        """
+        return ' '.join(map(str, dimensions)) if isinstance(dimensions, list) else str(dimensions)
+
     @staticmethod
     def __get_array_dimensions__(array_list) -> int:
         if len(array_list) == 0:
@@ -101,8 +111,8 @@ class Tag(PyLogixObject):
 
     def __construct_data_set__(self):
         """ construct inner data set of tag based on tag's datatype\n
-            if no data type exists, data will be set to None"""
-        if not self.datatype:
+            if no data type exists, or the tag is an alias (its data belongs to the aliased tag), data will be set to None"""
+        if not self.datatype or self.tag_type == LogixTagType.alias:
             self.data = None
             return
         self.data = self.__resolve_data_from_atomic_datatype__() if self.datatype.is_atomic else self.__resolve_data_from_complex_datatype__()
@@ -124,12 +134,13 @@ class Tag(PyLogixObject):
                     'Radix': 'Decimal',
                     'Dimensions': [0] * self.dimensions}
 
+        # rows are built by repeating the (immutable) zero, only the row lists themselves must be distinct
         if len(self.dimensions) == 1:
-            dim = [0] * self.dimensions
+            dim = [0] * self.dimensions[0]
         elif len(self.dimensions) == 2:
-            dim = [[0 for x in range(self.dimensions[1])] for y in range(self.dimensions[0])]
+            dim = [[0] * self.dimensions[1] for _ in range(self.dimensions[0])]
         elif len(self.dimensions) == 3:
-            dim = [[0 for x in range(self.dimensions[1])] for y in range(self.dimensions[0])]
+            dim = [[[0] * self.dimensions[2] for _ in range(self.dimensions[1])] for _ in range(self.dimensions[0])]
         else:
             raise ValueError('could not resolve dimensions for tag. Cannot resolve datatype structure.')
 
@@ -145,10 +156,16 @@ class Tag(PyLogixObject):
         data = {'Type': 'Structure',
                 'DataType': self.datatype.name,
                 'Members': []}
-        for member in self.datatype.members:
+        # walk the member tree with an explicit stack, so deeply nested datatypes never touch the recursion limit
+        stack = [(data['Members'], member) for member in reversed(self.datatype.members)]
+        while stack:
+            members, member = stack.pop()
             member_data = self.__resolve_data_from_member__(member)
-            if member_data:
-                data['Members'].append(member_data)
+            if not member_data:
+                continue
+            members.append(member_data)
+            if not member.datatype.is_atomic:
+                stack.extend((member_data['Members'], sec_member) for sec_member in reversed(member.datatype.members))
         return data
 
     def __resolve_data_from_member__(self, member: DataTypeMember):
@@ -173,7 +190,12 @@ class Tag(PyLogixObject):
                     'Value': 0}
         return data
 
-    def __resolve_data_from_complex_member__(self, member: DataTypeMember):
+    @staticmethod
+    def __resolve_data_from_complex_member__(member: DataTypeMember):
+        """ resolve the (empty) data-set of a complex member
+
+            its members are filled in by __resolve_data_from_complex_datatype__
+            """
         if not member.dimensions:
             data = {'Type': 'StructureMember',
                     'Name': member.name,
@@ -185,215 +207,208 @@ class Tag(PyLogixObject):
                     'DataType': member.datatype_meta_name,
                     'Dimensions': [0] * member.dimensions,
                     'Members': []}
-
-        for sec_member in member.datatype.members:
-            member_data = self.__resolve_data_from_member__(sec_member)
-            if member_data:
-                data['Members'].append(member_data)
         return data
 
-    def __read_structured_l5x_data__(self, data: {}, l5x_node: minidom.Element):
-        if data['Type'] == 'DataValueMember':
-            nodes = l5x_node.getElementsByTagName('DataValueMember')
-            node = next((node for node in nodes if (node.getAttribute('Name') == data['Name']) and (
-                    node.getAttribute('DataType') == data['DataType'])), None)
-            if not node:
-                return
-            data['Value'] = node.getAttribute('Value')
+    @staticmethod
+    def __index_structured_members__(l5x_node: etree._Element) -> {(str, str, str): etree._Element}:
+        """ index the direct member children of a structure node by (member type, Name, DataType)
+
+            decorated data always nests a member directly under its parent, so the subtree is never walked.
+            built once per structure so each member lookup is a dict hit rather than a scan of its siblings
+            """
+        index = {}
+        for node in l5x_node.iterchildren(etree.Element):
+            ga = node.attrib.get
+            index.setdefault((node.tag, ga('Name', ''), ga('DataType', '')), node)
+        return index
+
+    def __read_structured_l5x_data__(self, data: {}, member_nodes: {(str, str, str): etree._Element}):
+        member_type = data['Type']
+        node = member_nodes.get((member_type, data['Name'], data['DataType']))
+        if node is None:
             return
 
-        if data['Type'] == 'ArrayMember':
-            nodes = l5x_node.getElementsByTagName('ArrayMember')
-            node = next((node for node in nodes if
-                         node.getAttribute('Name') == data['Name'] and node.getAttribute('DataType') == data[
-                             'DataType']), None)
-            if not node:
-                return
-            parsed_nodes = [x for x in node.getElementsByTagName('Element') if
-                            (isinstance(x, minidom.Element) and (x.parentNode == node))]
+        if member_type == 'DataValueMember':
+            data['Value'] = node.get('Value', '')
+            return
+
+        if member_type == 'ArrayMember':
+            parsed_nodes = node.iterchildren('Element')
             for index, value_node in enumerate(parsed_nodes):
-                data['Dimensions'][index] = value_node.getAttribute('Value')
+                data['Dimensions'][index] = value_node.get('Value', '')
             return
 
-        if data['Type'] == 'StructureMember':
-            nodes = l5x_node.getElementsByTagName('StructureMember')
-            node = next((node for node in nodes if
-                         node.getAttribute('Name') == data['Name'] and node.getAttribute('DataType') == data[
-                             'DataType']), None)
-            if not node:
-                return
+        if member_type == 'StructureMember':
+            child_member_nodes = self.__index_structured_members__(node)
             for member in data['Members']:
-                self.__read_structured_l5x_data__(member, node)
+                self.__read_structured_l5x_data__(member, child_member_nodes)
 
-    def __read_decorated_xml_node__(self, l5x_node: minidom.Element):
+    def __read_decorated_xml_node__(self, l5x_node: etree._Element):
         """ this first section deals with data value only - meaning, it's not part of a UDT and the data is a single value
         """
         if not self.data:
             return
+        data_type = self.data['Type']
 
-        if self.data['Type'] == 'DataValue':
-            data_value_node = get_first_element(l5x_node, 'DataValue')
-            if not data_value_node:
+        if data_type == 'DataValue':
+            data_value_node = l5x_node.find('DataValue')
+            if data_value_node is None:
                 return
             try:
-                self.data['Value'] = int(data_value_node.getAttribute('Value'))
+                self.data['Value'] = int(data_value_node.get('Value', ''))
             except ValueError:
                 pass
             return
 
-        if self.data['Type'] == 'Array':
-            array_node = get_first_element(l5x_node, 'Array')
-            if not array_node:
+        if data_type == 'Array':
+            array_node = l5x_node.find('Array')
+            if array_node is None:
                 return
-            parsed_nodes = [x for x in array_node.getElementsByTagName('Element') if
-                            (isinstance(x, minidom.Element) and (x.parentNode == array_node))]
+            parsed_nodes = array_node.iterchildren('Element')
             for index, value_node in enumerate(parsed_nodes):
-                filtered_index = value_node.getAttribute('Index').replace('[', '').replace(']', '').split(',')
+                filtered_index = value_node.get('Index', '').replace('[', '').replace(']', '').split(',')
                 match len(filtered_index):
                     case 1:
-                        self.data['Dimensions'][index] = value_node.getAttribute('Value')
+                        self.data['Dimensions'][index] = value_node.get('Value', '')
                     case 2:
                         self.data['Dimensions'][int(filtered_index[0])][
-                            int(filtered_index[1])] = value_node.getAttribute('Value')
+                            int(filtered_index[1])] = value_node.get('Value', '')
                     case 3:
                         self.data['Dimensions'][int(filtered_index[0])][int(filtered_index[1])][
-                            int(filtered_index[2])] = value_node.getAttribute('Value')
+                            int(filtered_index[2])] = value_node.get('Value', '')
             return
 
         """ if for some reason we aren't a structure by this point, return
             something weird is going on or i haven't finished... whatever
         """
-        if self.data['Type'] != 'Structure':
+        if data_type != 'Structure':
             return
 
-        structure_node = get_first_element(l5x_node, 'Structure')
-        if not structure_node:
+        structure_node = l5x_node.find('Structure')
+        if structure_node is None:
             return
 
+        member_nodes = self.__index_structured_members__(structure_node)
         for member in self.data['Members']:
-            self.__read_structured_l5x_data__(member, structure_node)
-
-    def __write_structured_l5x_data__(self, data: {}, root: minidom.Document):
-        if data['Type'] == 'DataValueMember':
-            local_root = root.createElement(data['Type'])
-            local_root.setAttribute('Name', data['Name'])
-            local_root.setAttribute('DataType', data['DataType'])
-            if data['Radix']:
-                local_root.setAttribute('Radix', data['Radix'])
-            local_root.setAttribute('Value', str(data['Value']) if data['Value'] else "0")
-            return local_root
-
-        if data['Type'] == 'ArrayMember':
-            local_root = root.createElement(data['Type'])
-            local_root.setAttribute('Name', data['Name'])
-            local_root.setAttribute('DataType', data['DataType'])
-            local_root.setAttribute('Dimensions', str(len(data['Dimensions'])))
-            try:
-                local_root.setAttribute('Radix', data['Radix'])
-            except KeyError:
-                pass
-
-            if not isinstance(data['Dimensions'], list):
-                for index, value in enumerate(data['Dimensions']):
-                    dimension_root = root.createElement('Element')
-                    dimension_root.setAttribute('Index', f'[{str(index)}]')
-                    dimension_root.setAttribute('Value', str(value) if value else '0')
-                    local_root.appendChild(dimension_root)
+            self.__read_structured_l5x_data__(member, member_nodes)
+
+    def __write_structured_l5x_data__(self, data: {}, parent: etree._Element):
+        member_type = data['Type']
+        if member_type == 'DataValueMember':
+            attributes = {'Name': data['Name'],
+                          'DataType': data['DataType']}
+            radix = data['Radix']
+            if radix:
+                attributes['Radix'] = radix
+            value = data['Value']
+            attributes['Value'] = str(value) if value else '0'
+            return etree.SubElement(parent, member_type, attrib=attributes)
+
+        if member_type == 'ArrayMember':
+            dimensions = data['Dimensions']
+            attributes = {'Name': data['Name'],
+                          'DataType': data['DataType'],
+                          'Dimensions': str(len(dimensions))}
+            if 'Radix' in data:
+                attributes['Radix'] = data['Radix']
+            local_root = etree.SubElement(parent, member_type, attrib=attributes)
+            sub_element = etree.SubElement
+
+            if not isinstance(dimensions, list):
+                for index, value in enumerate(dimensions):
+                    sub_element(local_root, 'Element', attrib={'Index': f'[{index}]',
+                                                               'Value': str(value) if value else '0'})
                 return local_root
 
-            match self.__get_array_dimensions__(data['Dimensions']):
+            match self.__get_array_dimensions__(dimensions):
                 case 1:
-                    for index1, value1 in enumerate(data['Dimensions']):
-                        dimension_root = root.createElement('Element')
-                        dimension_root.setAttribute('Index', f'[{str(index1)}]')
-                        dimension_root.setAttribute('Value', str(value1) if value1 else '0')
-                        local_root.appendChild(dimension_root)
-                        return local_root
+                    for index1, value1 in enumerate(dimensions):
+                        sub_element(local_root, 'Element', attrib={'Index': f'[{index1}]',
+                                                                   'Value': str(value1) if value1 else '0'})
+                    return local_root
                 case 2:
-                    for index1 in data['Dimensions'][0]:
-                        for index2, value2 in enumerate(data['Dimensions'][1]):
-                            dimension_root = root.createElement('Element')
-                            dimension_root.setAttribute('Index', f'[{str(index1)}, {str(index2)}]')
-                            dimension_root.setAttribute('Value', str(value2) if value2 else '0')
-                            local_root.appendChild(dimension_root)
-                            return local_root
+                    for index1, value1 in enumerate(dimensions):
+                        prefix = f'[{index1}, '
+                        for index2, value2 in enumerate(value1):
+                            sub_element(local_root, 'Element', attrib={'Index': f'{prefix}{index2}]',
+                                                                       'Value': str(value2) if value2 else '0'})
+                    return local_root
                 case 3:
-                    for index1 in data['Dimensions'][0]:
-                        for index2 in data['Dimensions'][1]:
-                            for index3, value3 in enumerate(data['Dimensions'][2]):
-                                dimension_root = root.createElement('Element')
-                                dimension_root.setAttribute('Index', f'[{str(index1)}, {str(index2)}, {str(index3)}]')
-                                dimension_root.setAttribute('Value', str(value3) if value3 else '0')
-                                local_root.appendChild(dimension_root)
-                                return local_root
+                    for index1, value1 in enumerate(dimensions):
+                        for index2, value2 in enumerate(value1):
+                            prefix = f'[{index1}, {index2}, '
+                            for index3, value3 in enumerate(value2):
+                                sub_element(local_root, 'Element',
+                                            attrib={'Index': f'{prefix}{index3}]',
+                                                    'Value': str(value3) if value3 else '0'})
+                    return local_root
                 case _:
                     raise Exception('We should not be here.')
 
-        if data['Type'] == 'StructureMember':
-            local_root = root.createElement(data['Type'])
-            local_root.setAttribute('Name', data['Name'])
-            local_root.setAttribute('DataType', data['DataType'])
+        if member_type == 'StructureMember':
+            local_root = etree.SubElement(parent, member_type, attrib={'Name': data['Name'],
+                                                                      'DataType': data['DataType']})
 
             for member in data['Members']:
-                local_root.appendChild(self.__write_structured_l5x_data__(member, root))
+                self.__write_structured_l5x_data__(member, local_root)
 
             return local_root
 
-    def __write_l5x_tag_data__(self, root: minidom.Document):
+    def __write_l5x_tag_data__(self, parent: etree._Element):
         """ this first section deals with data value only - meaning, it's not part of a UDT and the data is a single value
                 """
         if not self.data:
             return
-        if self.data['Type'] == 'DataValue':
-            local_root = root.createElement(self.data['Type'])
-            local_root.setAttribute('DataType', self.data['DataType'])
-            local_root.setAttribute('Radix', self.data['Radix'])
-            local_root.setAttribute('Value', str(self.data['Value']) if self.data['Value'] else "0")
-            return local_root
-
-        if self.data['Type'] == 'Array':
-            local_root = root.createElement(self.data['Type'])
-            local_root.setAttribute('DataType', self.data['DataType'])
-            local_root.setAttribute('Radix', self.data['Radix'])
-
-            if not isinstance(self.data['Dimensions'], list):
-                for index, value in enumerate(self.data['Dimensions']):
-                    dimension_root = root.createElement('Element')
-                    dimension_root.setAttribute('Index', f'[{str(index)}]')
-                    dimension_root.setAttribute('Value', str(value) if value else '0')
-                    local_root.setAttribute('Dimensions', str(self.data['Dimensions']))
-                    local_root.appendChild(dimension_root)
+        data = self.data
+        data_type = data['Type']
+        if data_type == 'DataValue':
+            value = data['Value']
+            return etree.SubElement(parent, data_type, attrib={'DataType': data['DataType'],
+                                                               'Radix': data['Radix'],
+                                                               'Value': str(value) if value else '0'})
+
+        if data_type == 'Array':
+            dimensions = data['Dimensions']
+            local_root = etree.SubElement(parent, data_type, attrib={'DataType': data['DataType'],
+                                                                     'Radix': data['Radix']})
+            sub_element = etree.SubElement
+
+            # the dimensions attribute is only written once at least one element has been written
+            if not isinstance(dimensions, list):
+                for index, value in enumerate(dimensions):
+                    sub_element(local_root, 'Element', attrib={'Index': f'[{index}]',
+                                                               'Value': str(value) if value else '0'})
+                if len(local_root):
+                    local_root.set('Dimensions', str(dimensions))
                 return local_root
 
-            match self.__get_array_dimensions__(self.data['Dimensions']):
+            match self.__get_array_dimensions__(dimensions):
                 case 1:
-                    for index1, value1 in enumerate(self.data['Dimensions']):
-                        dimension_root = root.createElement('Element')
-                        dimension_root.setAttribute('Index', f'[{str(index1)}]')
-                        dimension_root.setAttribute('Value', str(value1) if value1 else '0')
-                        local_root.setAttribute('Dimensions', str(len(self.data['Dimensions'])))
-                        local_root.appendChild(dimension_root)
+                    for index1, value1 in enumerate(dimensions):
+                        sub_element(local_root, 'Element', attrib={'Index': f'[{index1}]',
+                                                                   'Value': str(value1) if value1 else '0'})
+                    if len(local_root):
+                        local_root.set('Dimensions', str(len(dimensions)))
                     return local_root
                 case 2:
-                    for index1, value1 in enumerate(self.data['Dimensions']):
+                    for index1, value1 in enumerate(dimensions):
+                        prefix = f'[{index1},'
                         for index2, value2 in enumerate(value1):
-                            dimension_root = root.createElement('Element')
-                            dimension_root.setAttribute('Index', f'[{str(index1)},{str(index2)}]')
-                            dimension_root.setAttribute('Value', str(value2) if value2 else '0')
-                            local_root.setAttribute('Dimensions',
-                                                    f'{str(len(self.data['Dimensions']))},{str(len(self.data['Dimensions'][0]))}')
-                            local_root.appendChild(dimension_root)
+                            sub_element(local_root, 'Element', attrib={'Index': f'{prefix}{index2}]',
+                                                                       'Value': str(value2) if value2 else '0'})
+                    if len(local_root):
+                        local_root.set('Dimensions', f'{len(dimensions)},{len(dimensions[0])}')
                     return local_root
                 case 3:
-                    for index1, value1 in enumerate(self.data['Dimensions']):
+                    for index1, value1 in enumerate(dimensions):
                         for index2, value2 in enumerate(value1):
+                            prefix = f'[{index1},{index2},'  # shared by every element of this row
                             for index3, value3 in enumerate(value2):
-                                dimension_root = root.createElement('Element')
-                                dimension_root.setAttribute('Index', f'[{str(index1)},{str(index2)},{str(index3)}]')
-                                dimension_root.setAttribute('Value', str(value3) if value3 else '0')
-                                local_root.setAttribute('Dimensions',
-                                                        f'{str(len(self.data['Dimensions']))},{str(len(self.data['Dimensions'][0]))},{str(len(self.data['Dimensions'][1]))}')
-                                local_root.appendChild(dimension_root)
+                                sub_element(local_root, 'Element',
+                                            attrib={'Index': f'{prefix}{index3}]',
+                                                    'Value': str(value3) if value3 else '0'})
+                    if len(local_root):
+                        local_root.set('Dimensions', f'{len(dimensions)},{len(dimensions[0])},{len(dimensions[0][0])}')
                     return local_root
                 case _:
                     raise Exception('We should not be here.')
@@ -401,56 +416,88 @@ class Tag(PyLogixObject):
         """ if for some reason we aren't a structure by this point, return
             something weird is going on or i haven't finished... whatever
         """
-        if self.data['Type'] != 'Structure':
+        if data_type != 'Structure':
             return
 
-        local_root = root.createElement(self.data['Type'])
-        local_root.setAttribute('DataType', self.data['DataType'])
-        for member in self.data['Members']:
-            local_root.appendChild(self.__write_structured_l5x_data__(member, root))
+        local_root = etree.SubElement(parent, data_type, attrib={'DataType': data['DataType']})
+        for member in data['Members']:
+            self.__write_structured_l5x_data__(member, local_root)
 
         return local_root
 
+    def clone(self) -> Self:
+        """ copy this tag for editing\n
+            the copy owns its data set and dimensions, so editing either never reaches this tag
+            (the datatype stays shared)
+            """
+        _clone = super().clone()
+        _clone.data = deepcopy(self.data)
+        if isinstance(self.dimensions, list):
+            _clone.dimensions = list(self.dimensions)
+        return _clone
+
+    def fast_clone(self,
+                   *,
+                   name: str | None = None,
+                   alias_for: str | Self | None = None,
+                   tag_type: LogixTagType | None = None,
+                   datatype: DataType | None = None) -> Self:
+        """ shallow copy this tag (without rebuilding its data set) and override the supplied fields\n
+            name and tag_type are kept when not supplied. alias_for and datatype are always replaced
+            """
+        clone = copy(self)
+        if name is not None:
+            clone.name = name
+        clone.alias_for = alias_for
+        if tag_type is not None:
+            clone.tag_type = tag_type
+        clone.datatype = datatype
+        return clone
+
     def get_dependencies(self,
-                         include_root: bool = False) -> PyLogixDependencies:
-        dependencies = PyLogixDependencies()
+                         include_root: bool = False,
+                         *,
+                         _acc: PyLogixDependencies | None = None) -> PyLogixDependencies:
+        dependencies = _acc if _acc is not None else PyLogixDependencies()
         if include_root:
-            dependencies.safe_add_item(dependencies.tags,
-                                       self)
+            dependencies.add_item('tags',
+                                  self)
         if self.datatype:
-            dependencies.extend(self.datatype.get_dependencies(include_root=True))
+            self.datatype.get_dependencies(include_root=True,
+                                           _acc=dependencies)
         return dependencies
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
-        if not xml_node:
+        if xml_node is None:
             return None
+        ga = dict(xml_node.attrib).get
+        datatype_name = ga('DataType', '')
         try:
-            datatype = kwargs['datatypes'].by_name(xml_node.getAttribute('DataType'))
+            datatype = kwargs['datatypes'].by_name(datatype_name)
         except KeyError:
             datatype = None
 
-        tag = cls(xml_node.getAttribute('Name'),
+        tag = cls(ga('Name', ''),
                   get_text_data(xml_node, 'Description'),
-                  LogixClass.from_string(xml_node.getAttribute('Class')),
-                  LogixTagType.from_string(xml_node.getAttribute('TagType')),
+                  LogixClass.from_string(ga('Class', '')),
+                  LogixTagType.from_string(ga('TagType', '')),
                   datatype,
-                  xml_node.getAttribute('DataType'),
-                  LogixRadix.from_string(xml_node.getAttribute('Radix')),
-                  bool_from_l5x(xml_node.getAttribute('Constant')),
-                  xml_node.getAttribute('ExternalAccess'),
-                  xml_node.getAttribute('Dimensions'),
-                  xml_node.getAttribute('AliasFor'),
-                  TagUsage.from_string(xml_node.getAttribute('Usage')))
-
-        """ try to get decorated tag data from node
+                  datatype_name,
+                  LogixRadix.from_string(ga('Radix', '')),
+                  bool_from_l5x(ga('Constant', '')),
+                  ga('ExternalAccess', ''),
+                  ga('Dimensions', ''),
+                  ga('AliasFor', ''),
+                  TagUsage.from_string(ga('Usage', '')))
+
+        """ try to get decorated tag data from node (data nodes are direct children of the tag)
         """
-        data_nodes = xml_node.getElementsByTagName('Data')
-        decorated_node = next((x for x in data_nodes if x.getAttribute('Format') == 'Decorated'), None)
-        if decorated_node:
+        decorated_node = next((x for x in xml_node.iterchildren('Data') if x.get('Format', '') == 'Decorated'), None)
+        if decorated_node is not None:
             tag.__read_decorated_xml_node__(decorated_node)
 
         return tag
@@ -470,55 +517,47 @@ class Tag(PyLogixObject):
         except KeyError:
             return
 
-    def rename_strings(self,
-                       _old_name: str,
-                       _new_name: str):
-        super().rename_strings(_old_name, _new_name)
-        if self.alias_for:
-            self.alias_for = self.alias_for.replace(_old_name, _new_name)
+    def apply_renames(self,
+                      mapping: {str: str}):
+        super().apply_renames(mapping)
+        self.alias_for = self.__apply_renames__(self.alias_for, mapping)
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        tag_root = root.createElement('Tag')
-        tag_root.setAttribute('Name', self.name)
+                        include_dependencies: bool = False) -> etree._Element:
+        attributes = {'Name': self.name}
 
         if self.logix_class:
-            tag_root.setAttribute('Class', self.logix_class.value)
+            attributes['Class'] = self.logix_class.value
 
-        tag_root.setAttribute('TagType', self.tag_type.value.__str__())
+        attributes['TagType'] = self.tag_type.value
 
         if self.alias_for:
-            tag_root.setAttribute('AliasFor', self.alias_for)
+            attributes['AliasFor'] = self.alias_for
         else:
-            tag_root.setAttribute('DataType', self.datatype_meta_name)
+            attributes['DataType'] = self.datatype_meta_name
 
             if self.dimensions:
-                tag_root.setAttribute('Dimensions', str(self.dimensions).replace('[', '').replace(']', ''))
+                attributes['Dimensions'] = self.__dimensions_to_l5x__(self.dimensions)
 
             if self.radix:
-                tag_root.setAttribute('Radix', self.radix.value)
+                attributes['Radix'] = self.radix.value
 
-            tag_root.setAttribute('Constant', bool_to_l5x(self.constant))
+            attributes['Constant'] = bool_to_l5x(self.constant)
 
         if self.usage:
-            tag_root.setAttribute('Usage', self.usage.value)
+            attributes['Usage'] = self.usage.value
 
-        tag_root.setAttribute('ExternalAccess', self.external_access)
+        attributes['ExternalAccess'] = self.external_access
+        tag_root = etree.Element('Tag', attrib=attributes)
 
         if self.description:
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            tag_root.appendChild(desc_root)
+            desc_root = etree.SubElement(tag_root, 'Description')
+            desc_root.text = etree.CDATA(self.description)
 
         if self.data:
-            data_root = root.createElement('Data')
-            data_root.setAttribute('Format', 'Decorated')
-            data_child = self.__write_l5x_tag_data__(root)
-            if data_child:
-                data_root.appendChild(data_child)
-            tag_root.appendChild(data_root)
+            data_root = etree.SubElement(tag_root, 'Data', attrib={'Format': 'Decorated'})
+            self.__write_l5x_tag_data__(data_root)
 
         return tag_root
 
@@ -11,10 +11,14 @@ from program import Program, ProgramList
 from base import TaskType, LogixClass, PyLogixObject, PylogixList, PyLogixDependencies
 
 # python std lib imports #
-from xml.dom import minidom
+
+# 3rd party imports #
+from lxml import etree
 
 
 class Task(PyLogixObject):
+    __slots__ = ('task_type', 'priority', 'rate', 'watchdog', 'disable_update_outputs', 'inhibit_task', 'task_class',
+                 'scheduled_meta_programs', 'scheduled_programs')
 
     def __init__(self,
                  name: str,
@@ -40,35 +44,41 @@ class Task(PyLogixObject):
 
     @classmethod
     def from_l5x_xml_node(cls,
-                          xml_node: minidom.Element,
+                          xml_node: etree._Element,
                           *args,
                           **kwargs):
-        if not xml_node:
+        if xml_node is None:
             return None
-        task = cls(xml_node.getAttribute('Name'),
+        ga = dict(xml_node.attrib).get
+        task = cls(ga('Name', ''),
                    get_text_data(xml_node, 'Description'),
-                   TaskType.from_string(xml_node.getAttribute('Type')),
-                   int(xml_node.getAttribute('Priority')),
-                   int(xml_node.getAttribute('Watchdog')),
-                   bool_from_l5x(xml_node.getAttribute('DisableUpdateOutputs')),
-                   bool_from_l5x(xml_node.getAttribute('InhibitTask')),
-                   LogixClass.from_string(xml_node.getAttribute('Class')),
-                   xml_node.getAttribute('Rate'))
-
-        # parse through members if they exist
-        programs_list_xml = xml_node.getElementsByTagName('ScheduledPrograms')[0]
-        if programs_list_xml:
-            for program_xml in [x for x in programs_list_xml.childNodes if isinstance(x, minidom.Element)]:
-                task.scheduled_programs.append(kwargs['programs'].by_name(program_xml.getAttribute('Name')))
-                task.scheduled_meta_programs.append(program_xml.getAttribute('Name'))
+                   TaskType.from_string(ga('Type', '')),
+                   int(ga('Priority', '')),
+                   int(ga('Watchdog', '')),
+                   bool_from_l5x(ga('DisableUpdateOutputs', '')),
+                   bool_from_l5x(ga('InhibitTask', '')),
+                   LogixClass.from_string(ga('Class', '')),
+                   ga('Rate', ''))
+
+        # parse through members if they exist (scheduled programs are a direct child of the task)
+        programs_list_xml = xml_node.find('ScheduledPrograms')
+        if programs_list_xml is not None:
+            programs = kwargs['programs']
+            for program_xml in programs_list_xml.iterchildren(etree.Element):
+                program_name = program_xml.get('Name', '')
+                task.scheduled_programs.append(programs.by_name(program_name))
+                task.scheduled_meta_programs.append(program_name)
 
         return task
 
     def get_dependencies(self,
-                         include_root: bool = False) -> PyLogixDependencies:
-        dependencies = PyLogixDependencies()
+                         include_root: bool = False,
+                         *,
+                         _acc: PyLogixDependencies | None = None) -> PyLogixDependencies:
+        dependencies = _acc if _acc is not None else PyLogixDependencies()
         if include_root:
-            dependencies.tasks.append(self)
+            dependencies.add_item('tasks',
+                                  self)
         return dependencies
 
     def rebind(self,
@@ -77,37 +87,30 @@ class Task(PyLogixObject):
         """ rebind this object as required
         """
         super().rebind()
-        self.scheduled_programs = [prog for prog in kwargs['programs'] if prog.name in self.scheduled_meta_programs]
+        scheduled_names = set(self.scheduled_meta_programs)
+        self.scheduled_programs = [prog for prog in kwargs['programs'] if prog.name in scheduled_names]
 
     def to_l5x_xml_node(self,
-                        root: minidom.Document,
                         as_target: bool = False,
-                        include_dependencies: bool = False) -> minidom.Element:
-        task_root = root.createElement('Task')
-        task_root.setAttribute('Name', self.name)
-        task_root.setAttribute('Type', self.task_type.value.__str__())
-
+                        include_dependencies: bool = False) -> etree._Element:
+        attributes = {'Name': self.name,
+                      'Type': self.task_type.value}
         if self.rate:
-            task_root.setAttribute('Rate', self.rate)
-
-        task_root.setAttribute('Priority', str(self.priority))
-        task_root.setAttribute('Watchdog', str(self.watchdog))
-        task_root.setAttribute('DisableUpdateOutputs', bool_to_l5x(self.disable_update_outputs))
-        task_root.setAttribute('InhibitTask', bool_to_l5x(self.inhibit_task))
-        task_root.setAttribute('Class', self.task_class.value.__str__())
+            attributes['Rate'] = self.rate
+        attributes['Priority'] = str(self.priority)
+        attributes['Watchdog'] = str(self.watchdog)
+        attributes['DisableUpdateOutputs'] = bool_to_l5x(self.disable_update_outputs)
+        attributes['InhibitTask'] = bool_to_l5x(self.inhibit_task)
+        attributes['Class'] = self.task_class.value
+        task_root = etree.Element('Task', attrib=attributes)
 
         if self.description:
-            desc_root = root.createElement('Description')
-            desc_root.appendChild(root.createCDATASection(self.description))
-            task_root.appendChild(desc_root)
+            desc_root = etree.SubElement(task_root, 'Description')
+            desc_root.text = etree.CDATA(self.description)
 
-        programs_root = root.createElement('ScheduledPrograms')
+        programs_root = etree.SubElement(task_root, 'ScheduledPrograms')
         for prog in self.scheduled_programs:
-            scheduled_program = root.createElement('ScheduledProgram')
-            scheduled_program.setAttribute('Name', prog.name)
-            programs_root.appendChild(scheduled_program)
-
-        task_root.appendChild(programs_root)
+            etree.SubElement(programs_root, 'ScheduledProgram', attrib={'Name': prog.name})
 
         return task_root
 